@@ -0,0 +1,254 @@
+# artifacts.py
+# 모델 파일(아티팩트) 다운로드: 임시 파일(.part)로 이어받기 → 체크섬 확인 → 원자적 rename.
+# 호스트당 한 프로세스만 다운로드하고(파일 락) 나머지는 기다렸다가 결과를 그대로 쓴다.
+# URL 은 Google Drive(gdown), http(s)(Range 이어받기), file:// / 로컬 경로를 지원하므로
+# 로컬 HTTP 서버나 파일로 오프라인 테스트가 가능하다.
+import os, json, shutil, hashlib, logging, urllib.error, urllib.request
+from contextlib import contextmanager
+from urllib.parse import urlparse, unquote
+
+try:
+    import fcntl
+except ImportError:  # Windows: 락 없이 동작
+    fcntl = None
+
+log = logging.getLogger(__name__)
+CHUNK = 1 << 20
+
+
+class ArtifactError(RuntimeError):
+    pass
+
+
+def gdrive_url(file_id: str) -> str:
+    return f"https://drive.google.com/uc?id={file_id}"
+
+
+def sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(CHUNK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+@contextmanager
+def file_lock(path: str):
+    """path 에 대한 호스트 단위 배타 락 (다른 프로세스는 풀릴 때까지 대기)."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "a") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+# ---------- 검증 ----------
+def _stamp(path: str) -> str:
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def verify(path: str, sha256: str | None) -> bool:
+    """체크섬 확인. 한 번 확인한 결과는 <path>.sha256 에 (크기, mtime) 과 함께 기록해 재해시를 피함."""
+    if not os.path.exists(path):
+        return False
+    if not sha256:
+        return True
+    sidecar = f"{path}.sha256"
+    try:
+        with open(sidecar, encoding="utf-8") as fh:
+            digest, stamp = fh.read().split()
+        if digest == sha256.lower() and stamp == _stamp(path):
+            return True
+    except (OSError, ValueError):
+        pass
+    digest = sha256_file(path)
+    if digest != sha256.lower():
+        return False
+    with open(sidecar, "w", encoding="utf-8") as fh:
+        fh.write(f"{digest} {_stamp(path)}\n")
+    return True
+
+
+# ---------- 다운로드 (이어받기) ----------
+# .part 옆에 <part>.meta 로 (url, etag, 전체 길이) 를 남겨, 출처나 원본이 바뀐 .part 를 이어받지 않는다.
+def _read_meta(part: str) -> dict | None:
+    try:
+        with open(f"{part}.meta", encoding="utf-8") as fh:
+            meta = json.load(fh)
+        return meta if isinstance(meta, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(part: str, url: str, etag: str | None = None, length: int | None = None) -> None:
+    with open(f"{part}.meta", "w", encoding="utf-8") as fh:
+        json.dump({"url": url, "etag": etag, "length": length}, fh)
+
+
+def _drop_part(part: str) -> None:
+    for path in (part, f"{part}.meta", f"{part}.sha256"):
+        try: os.remove(path)
+        except FileNotFoundError: pass
+
+
+def _check_size(url: str, part: str, length: int | None) -> None:
+    size = os.path.getsize(part)
+    if length is not None and size != length:
+        if size > length:
+            _drop_part(part)  # 짧으면 다음에 이어받고, 길면 쓸모없으니 버림
+        raise ArtifactError(f"크기 불일치: {url} ({size} != {length} bytes)")
+
+
+def _content_range(value: str | None) -> tuple[int, int | None] | None:
+    """'bytes 100-199/200' → (100, 200). 전체 길이가 '*' 면 None."""
+    try:
+        unit, rng = value.split(" ", 1)
+        span, total = rng.split("/", 1)
+        if unit != "bytes":
+            return None
+        return int(span.split("-", 1)[0]), None if total == "*" else int(total)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _download_http(url: str, part: str, timeout: float) -> None:
+    for _ in range(2):  # 이어받을 수 없는 응답이면 .part 를 버리고 한 번 더 (처음부터)
+        meta = _read_meta(part) or {}
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if meta.get("etag"):
+                headers["If-Range"] = meta["etag"]  # 원본이 바뀌었으면 서버가 206 대신 200 (전체) 으로 응답
+        try:
+            resp = urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:  # 범위 밖: 이미 끝까지 받았거나, 원본이 더 짧아짐
+                if offset == meta.get("length"):
+                    return
+                _drop_part(part)
+                continue
+            raise
+        with resp:
+            etag = resp.headers.get("ETag") or resp.headers.get("Last-Modified")
+            if offset and resp.status == 206:
+                start, length = _content_range(resp.headers.get("Content-Range")) or (None, None)
+                stale = (start != offset or length is None or meta.get("length") not in (None, length)
+                         or bool(meta.get("etag") and etag and etag != meta["etag"]))
+                if stale:
+                    log.warning("cannot resume %s (source changed), starting over", url)
+                    _drop_part(part)
+                    continue
+                mode = "ab"
+            else:  # 처음 받거나, 서버가 Range/If-Range 를 무시하고 전체를 보냄
+                length = resp.headers.get("Content-Length")
+                length = int(length) if length and length.isdigit() else None
+                mode = "wb"
+            _write_meta(part, url, etag, length)
+            with open(part, mode) as fh:
+                shutil.copyfileobj(resp, fh, CHUNK)
+        _check_size(url, part, length)
+        return
+    raise ArtifactError(f"이어받기 실패: {url}")
+
+
+def _download_file(url: str, src: str, part: str) -> None:
+    st = os.stat(src)
+    etag = f"{st.st_size}:{st.st_mtime_ns}"
+    offset = os.path.getsize(part) if os.path.exists(part) else 0
+    if offset and (offset > st.st_size or (_read_meta(part) or {}).get("etag") != etag):
+        offset = 0  # 원본 파일이 바뀜
+    _write_meta(part, url, etag, st.st_size)
+    with open(src, "rb") as fin, open(part, "ab" if offset else "wb") as fout:
+        fin.seek(offset)
+        shutil.copyfileobj(fin, fout, CHUNK)
+    _check_size(url, part, st.st_size)
+
+
+def _download_gdrive(url: str, part: str) -> None:
+    import gdown
+    _write_meta(part, url)  # gdown 이 이어받기/크기 확인을 직접 처리
+    if gdown.download(url, part, quiet=False, resume=True) is None:
+        raise ArtifactError(f"gdown 다운로드 실패: {url}")
+
+
+def download(url: str, part: str, timeout: float = 60.0) -> None:
+    scheme = urlparse(url).scheme
+    if "drive.google.com" in url:
+        _download_gdrive(url, part)
+    elif scheme in ("http", "https"):
+        _download_http(url, part, timeout)
+    elif scheme == "file":
+        _download_file(url, unquote(urlparse(url).path), part)
+    elif not scheme and os.path.exists(url):
+        _download_file(url, url, part)
+    else:
+        raise ArtifactError(f"지원하지 않는 URL: {url}")
+
+
+def fetch_artifact(url: str, dest: str, sha256: str | None = None, timeout: float = 60.0) -> str:
+    """url → dest. 이미 있고 체크섬이 맞으면 그대로 반환.
+
+    받는 중에는 <dest>.part 에 쓰고(중단되면 다음에 이어받음), 체크섬이 맞을 때만 dest 로 rename 한다.
+    .part 가 다른 url 에서 받던 것이거나 출처 정보(.part.meta)가 없으면 이어받지 않고 버린다.
+    크기나 체크섬이 틀리면 ArtifactError (체크섬이 틀린 .part 는 삭제).
+    """
+    if verify(dest, sha256):
+        return dest
+    with file_lock(f"{dest}.lock"):
+        if verify(dest, sha256):  # 기다리는 동안 다른 프로세스가 받아 둔 경우
+            return dest
+        if os.path.exists(dest):
+            log.warning("checksum mismatch, re-downloading %s", dest)
+            os.remove(dest)
+        part = f"{dest}.part"
+        if os.path.exists(part) and (_read_meta(part) or {}).get("url") != url:
+            log.warning("discarding stale %s (different or unknown source)", part)
+            _drop_part(part)
+        log.info("downloading %s -> %s", url, dest)
+        download(url, part, timeout)
+        if not verify(part, sha256):
+            _drop_part(part)
+            raise ArtifactError(f"체크섬 불일치: {url} (expected sha256={sha256})")
+        os.replace(part, dest)
+        if sha256:
+            os.replace(f"{part}.sha256", f"{dest}.sha256")
+        _drop_part(part)  # 남은 .part.meta 정리
+    return dest
+
+
+def model_cache_path(model_path: str, cache_dir: str | None, sha256: str | None, source: str) -> str:
+    """cache_dir 가 있으면 <cache_dir>/model/<version>/<파일명>, 없으면 model_path 그대로."""
+    if not cache_dir:
+        return model_path
+    store = ArtifactStore(cache_dir)
+    return store.path_for("model", store.version_for(sha256, source), os.path.basename(model_path))
+
+
+class ArtifactStore:
+    """버전별 로컬 캐시: <root>/<name>/<version>/<filename>."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    @staticmethod
+    def version_for(sha256: str | None, source: str) -> str:
+        """체크섬이 있으면 그 앞부분, 없으면 출처(URL/파일 ID) 해시로 버전 디렉터리 이름을 정함."""
+        return sha256[:16].lower() if sha256 else hashlib.sha1(source.encode()).hexdigest()[:16]
+
+    def path_for(self, name: str, version: str, filename: str) -> str:
+        return os.path.join(self.root, name, version, filename)
+
+    def versions(self, name: str) -> list[str]:
+        d = os.path.join(self.root, name)
+        return sorted(os.listdir(d)) if os.path.isdir(d) else []
+
+    def fetch(self, name: str, url: str, filename: str, sha256: str | None = None,
+              version: str | None = None) -> str:
+        version = version or self.version_for(sha256, url)
+        return fetch_artifact(url, self.path_for(name, version, filename), sha256)
@@ -0,0 +1,126 @@
+# batcher.py
+# 세션(스크립트 스레드) 간 공유 마이크로 배칭 스케줄러.
+# 여러 사용자가 동시에 업로드하면 요청을 큐에 모아 (최대 배치 크기, 최대 대기 시간) 기준으로 묶고
+# 배치당 forward 한 번으로 처리한 뒤, 결과를 요청한 세션에 Future 로 돌려준다.
+import time, queue, threading
+from collections import Counter
+from concurrent.futures import Future
+
+from PIL import Image
+
+from metrics import metrics
+
+_STOP = object()
+
+
+class BatchScheduler:
+    """LeanPredictor 앞단의 배칭 워커 (데몬 스레드 1개)."""
+
+    def __init__(self, predictor, max_batch: int = 8, max_wait_ms: float = 10.0):
+        self.predictor = predictor
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self._q: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._batch_sizes: Counter = Counter()
+        self._depths: Counter = Counter()
+        self._requests = 0
+        self._wait_ms_total = 0.0
+        self._errors = 0
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="batch-scheduler", daemon=True)
+        self._thread.start()
+
+    # ---------- 요청 ----------
+    def submit(self, pil: Image.Image) -> Future:
+        """이미지 1장 예측 요청. 전처리는 호출한 스레드에서 미리 해 두고 forward 만 배칭한다."""
+        if self._stopped:
+            raise RuntimeError("BatchScheduler 가 이미 종료되었습니다.")
+        fut: Future = Future()
+        x = self.predictor.preprocess(pil) if self.predictor.lean else pil
+        self._q.put((x, fut, time.perf_counter()))
+        return fut
+
+    def predict(self, pil: Image.Image, timeout: float | None = None):
+        return self.submit(pil).result(timeout)
+
+    def stop(self) -> None:
+        """대기 중인 요청까지 처리하고 워커를 종료. 종료와 경합해 늦게 들어온 요청은 예외로 끝낸다."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+        self._q.put(_STOP)
+        self._thread.join()
+        while True:
+            try:
+                item = self._q.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                item[1].set_exception(RuntimeError("BatchScheduler 가 종료되어 요청을 처리하지 못했습니다."))
+
+    # ---------- 워커 ----------
+    def _collect(self) -> list | None:
+        first = self._q.get()
+        if first is _STOP:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._q.get(timeout=remaining) if remaining > 0 else self._q.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._q.put(_STOP)  # 현재 배치를 처리한 다음 루프에서 종료
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            start = time.perf_counter()
+            with self._lock:
+                self._requests += len(batch)
+                self._batch_sizes[len(batch)] += 1
+                self._depths[self._q.qsize()] += 1
+                self._wait_ms_total += sum((start - t) * 1000 for _, _, t in batch)
+            for _, _, t in batch:
+                metrics.observe("queue_wait", (start - t) * 1000)
+            xs = [x for x, _, _ in batch]
+            try:
+                if self.predictor.lean:
+                    results = self.predictor.predict_tensors(xs)
+                else:
+                    results = self.predictor.predict_batch(xs)
+            except Exception as e:
+                with self._lock:
+                    self._errors += 1
+                for _, fut, _ in batch:
+                    fut.set_exception(e)
+                continue
+            for (_, fut, _), res in zip(batch, results):
+                fut.set_result(res)
+
+    # ---------- 지표 ----------
+    def stats(self) -> dict:
+        """queue depth / batch size 분포 (p50·p99 지연 vs 처리량 튜닝용)."""
+        with self._lock:
+            batches = sum(self._batch_sizes.values())
+            return {
+                "max_batch": self.max_batch,
+                "max_wait_ms": self.max_wait * 1000,
+                "queue_depth": self._q.qsize(),
+                "requests": self._requests,
+                "batches": batches,
+                "errors": self._errors,
+                "mean_batch_size": self._requests / batches if batches else 0.0,
+                "mean_queue_wait_ms": self._wait_ms_total / self._requests if self._requests else 0.0,
+                "batch_size_hist": dict(sorted(self._batch_sizes.items())),
+                "queue_depth_hist": dict(sorted(self._depths.items())),
+            }
@@ -0,0 +1,61 @@
+# bench_classify.py
+# classify.py 일괄 추론의 코어 수 대비 확장성 측정.
+# 합성 이미지 코퍼스와 작은 임의 CNN(bench_pipeline 의 --dummy 모델)을 TorchScript 로 export 해 두고,
+# --workers 값마다 classify.run 을 처음부터 돌려 처리량과 1 워커 대비 배율(효율)을 보고한다.
+#
+#   python bench_classify.py --workers 1 2 4 --images 512
+#   python bench_classify.py --lean-model model.lean.pt --resolution 1280x960 --json scaling.json
+import argparse, json, os, sys, tempfile, time
+
+from bench_pipeline import dummy_predictor, make_corpus, parse_res
+from classify import output_format, plan_cores, run
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="classify.py scaling benchmark (workers vs throughput)")
+    ap.add_argument("--lean-model", default=None, help="export_model.py 로 만든 TorchScript 파일 (기본: 임의 CNN)")
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--images", type=int, default=256)
+    ap.add_argument("--resolution", type=parse_res, default=(1280, 960))
+    ap.add_argument("--format", choices=["jpeg", "png", "webp", "tiff"], default="jpeg")
+    ap.add_argument("--chunk-size", type=int, default=32)
+    ap.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lean_path = args.lean_model or dummy_predictor().export(os.path.join(tmp, "dummy.lean.pt"))
+        paths = []
+        for i, (name, data) in enumerate(make_corpus([args.resolution], [args.format], args.images)):
+            paths.append(os.path.join(tmp, f"{i:05d}_{name}"))
+            with open(paths[-1], "wb") as fh:
+                fh.write(data)
+
+        cpus = os.cpu_count() or 1
+        print(f"{len(paths)} images {args.resolution[0]}x{args.resolution[1]} {args.format} | {cpus} cpus")
+        print(f"{'workers':>7} | {'decode':>6} | {'threads':>7} | {'img/s':>8} | {'speedup':>7} | {'eff':>5}")
+        print("-" * 56)
+        results, base = [], None
+        for w in args.workers:
+            out = os.path.join(tmp, f"out_{w}.jsonl")
+            decode, threads = plan_cores(cpus, w)
+            t0 = time.perf_counter()
+            n = run(paths, out, output_format(out, None), "", "", workers=w, chunk_size=args.chunk_size,
+                    lean_path=lean_path, log=lambda msg: None)
+            wall = time.perf_counter() - t0  # 프로세스 기동·모델 로드 포함
+            rate = n / wall if wall else 0.0
+            base = base or rate
+            r = {"workers": w, "decode_workers": decode, "threads": threads, "images": n,
+                 "wall_s": wall, "throughput_ips": rate, "speedup": rate / base if base else 0.0}
+            r["efficiency"] = r["speedup"] / (w / args.workers[0])
+            results.append(r)
+            print(f"{w:>7} | {decode:>6} | {threads:>7} | {rate:>8.1f} | {r['speedup']:>6.2f}x | {r['efficiency']:>5.2f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump({"cpus": cpus, "images": len(paths), "resolution": f"{args.resolution[0]}x{args.resolution[1]}",
+                       "format": args.format, "levels": results}, fh, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
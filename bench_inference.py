@@ -0,0 +1,85 @@
+# bench_inference.py
+# 경량 추론기(LeanPredictor) vs 기존 learner.predict: 결과 일치(parity) 확인 + 지연시간 비교
+#
+#   python bench_inference.py --model model.pkl                 # 합성 이미지로
+#   python bench_inference.py --model model.pkl --images ./samples --threads 2
+#
+# 예측 라벨이 다르거나 확률 차이가 --atol 을 넘으면 종료 코드 1 로 끝난다.
+import argparse, os, sys, time
+import numpy as np
+from PIL import Image
+
+from inference import LeanPredictor
+
+IMG_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff")
+
+
+def synthetic_images(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    sizes = [(224, 224), (640, 480), (480, 640), (1024, 768), (300, 200)]
+    for i in range(n):
+        w, h = sizes[i % len(sizes)]
+        yield f"synthetic_{i}_{w}x{h}", Image.fromarray(rng.integers(0, 256, (h, w, 3), dtype=np.uint8))
+
+
+def folder_images(path: str):
+    for name in sorted(os.listdir(path)):
+        if name.lower().endswith(IMG_EXTS):
+            with Image.open(os.path.join(path, name)) as im:
+                yield name, im.convert("RGB")
+
+
+def timed(fn, runs: int) -> list[float]:
+    out = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+
+def summary(ms: list[float]) -> str:
+    a = np.asarray(ms)
+    return f"mean {a.mean():7.2f} ms | p50 {np.percentile(a, 50):7.2f} | p95 {np.percentile(a, 95):7.2f}"
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="LeanPredictor parity + latency benchmark")
+    ap.add_argument("--model", default="model.pkl")
+    ap.add_argument("--images", default=None, help="이미지 폴더 (없으면 합성 이미지)")
+    ap.add_argument("-n", type=int, default=10, help="합성 이미지 개수")
+    ap.add_argument("--runs", type=int, default=20, help="이미지당 지연시간 측정 반복 수")
+    ap.add_argument("--threads", type=int, default=0)
+    ap.add_argument("--atol", type=float, default=1e-4)
+    args = ap.parse_args(argv)
+
+    from fastai.vision.all import load_learner, PILImage
+    learner = load_learner(args.model, cpu=True)
+    lean = LeanPredictor(learner, num_threads=args.threads or None)
+    if not lean.lean:
+        print("⚠️  이 모델의 transform 구성은 경량 경로를 지원하지 않아 learner.predict 로 대체됩니다.")
+
+    images = list(folder_images(args.images) if args.images else synthetic_images(args.n))
+    failures, worst = 0, 0.0
+    base_ms, lean_ms = [], []
+    for name, pil in images:
+        ref_pred, ref_idx, ref_probs = learner.predict(PILImage.create(np.array(pil)))
+        pred, idx, probs = lean.predict(pil)
+        diff = float(np.abs(np.asarray(ref_probs, dtype=np.float32) - probs).max())
+        worst = max(worst, diff)
+        if str(ref_pred) != pred or int(ref_idx) != idx or diff > args.atol:
+            failures += 1
+            print(f"✗ {name}: learner={ref_pred}({int(ref_idx)}) lean={pred}({idx}) max|Δp|={diff:.2e}")
+        base_ms += timed(lambda: learner.predict(PILImage.create(np.array(pil))), args.runs)
+        lean_ms += timed(lambda: lean.predict(pil), args.runs)
+
+    print(f"images: {len(images)}  runs/image: {args.runs}  threads: {args.threads or 'default'}")
+    print(f"parity: {len(images) - failures}/{len(images)} ok, worst max|Δp| = {worst:.2e} (atol {args.atol})")
+    print(f"learner.predict : {summary(base_ms)}")
+    print(f"LeanPredictor   : {summary(lean_ms)}")
+    print(f"speedup (p50)   : {np.percentile(base_ms, 50) / np.percentile(lean_ms, 50):.2f}x")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
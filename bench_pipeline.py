@@ -0,0 +1,170 @@
+# bench_pipeline.py
+# 브라우저 없이 돌리는 추론 파이프라인 부하 테스트.
+# 해상도 × 포맷(JPEG/PNG/WebP/TIFF)별 합성 이미지를 만들어 decode → preprocess → forward → postprocess 를
+# 지정한 동시성으로 밀어 넣고 처리량, p50/p95/p99 지연, 단계별 히스토그램, (실행 전체의) 최대 RSS 를 보고한다.
+#
+#   python bench_pipeline.py --model model.pkl --concurrency 1 4 16
+#   python bench_pipeline.py --lean-model model.lean.pt --mode batched --json bench.json
+#   python bench_pipeline.py --dummy            # 모델 없이 작은 임의 CNN 으로 (회귀 비교용)
+import argparse, json, sys, time
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image, features
+
+from inference import LeanPredictor, ResizeSpec, load_model, load_pil_from_bytes
+from batcher import BatchScheduler
+from metrics import metrics
+
+FORMATS = {"jpeg": "JPEG", "png": "PNG", "webp": "WEBP", "tiff": "TIFF"}
+
+
+def peak_rss_mb() -> float | None:
+    """프로세스 시작 이후의 최대 RSS (ru_maxrss 는 줄어들지 않으므로 동시성 수준별로 나눌 수 없음)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024  # macOS: bytes, Linux: KB
+
+
+def synthetic_image(w: int, h: int, seed: int) -> Image.Image:
+    """그라디언트 + 노이즈 (순수 노이즈보다 실제 사진에 가까운 압축률)."""
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+    base = np.stack([xx / max(w, 1), yy / max(h, 1), (xx + yy) / max(w + h, 1)], axis=-1) * 255
+    noise = rng.normal(0, 12, (h, w, 3))
+    return Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8))
+
+
+def make_corpus(resolutions: list[tuple[int, int]], formats: list[str], per_combo: int) -> list[tuple[str, bytes]]:
+    corpus = []
+    for w, h in resolutions:
+        for fmt in formats:
+            if fmt == "webp" and not features.check("webp"):
+                print("⚠️  이 Pillow 는 WebP 를 지원하지 않아 건너뜁니다.", file=sys.stderr)
+                continue
+            for i in range(per_combo):
+                buf = BytesIO()
+                synthetic_image(w, h, seed=i).save(buf, format=FORMATS[fmt])
+                corpus.append((f"{w}x{h}.{fmt}", buf.getvalue()))
+    return corpus
+
+
+def dummy_predictor(num_classes: int = 10) -> LeanPredictor:
+    import torch
+    model = torch.nn.Sequential(
+        torch.nn.Conv2d(3, 16, 3, stride=2, padding=1), torch.nn.ReLU(),
+        torch.nn.Conv2d(16, 32, 3, stride=2, padding=1), torch.nn.ReLU(),
+        torch.nn.AdaptiveAvgPool2d(1), torch.nn.Flatten(), torch.nn.Linear(32, num_classes),
+    )
+    return LeanPredictor.from_model(model, [f"class_{i}" for i in range(num_classes)], ResizeSpec((224, 224)),
+                                    [0.485, 0.456, 0.406], [0.229, 0.224, 0.225])
+
+
+def percentile(xs: list[float], q: float) -> float:
+    return float(np.percentile(xs, q)) if xs else 0.0
+
+
+def run_level(predict, corpus: list[tuple[str, bytes]], concurrency: int, repeat: int) -> dict:
+    work = corpus * repeat
+    lat: list[float] = []
+
+    def one(item):
+        t0 = time.perf_counter()
+        predict(load_pil_from_bytes(item[1]))
+        return (time.perf_counter() - t0) * 1000
+
+    metrics.reset()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        lat = list(pool.map(one, work))
+    wall = time.perf_counter() - t0
+    return {
+        "concurrency": concurrency,
+        "requests": len(work),
+        "wall_s": wall,
+        "throughput_rps": len(work) / wall if wall else 0.0,
+        "p50_ms": percentile(lat, 50),
+        "p95_ms": percentile(lat, 95),
+        "p99_ms": percentile(lat, 99),
+        "stages": metrics.snapshot()["stages"],
+    }
+
+
+def parse_res(s: str) -> tuple[int, int]:
+    w, h = s.lower().split("x")
+    return int(w), int(h)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="headless inference pipeline load test")
+    src = ap.add_mutually_exclusive_group()
+    src.add_argument("--model", default="model.pkl", help="fastai model.pkl")
+    src.add_argument("--lean-model", default=None, help="export_model.py 로 만든 TorchScript 파일")
+    src.add_argument("--dummy", action="store_true", help="모델 없이 작은 임의 CNN 사용")
+    ap.add_argument("--file-id", default="1lz0i2ZmAmpKPAsUL98Ke_MtqQpXTaKNo")
+    ap.add_argument("--resolutions", type=parse_res, nargs="+",
+                    default=[(320, 240), (1280, 960), (4000, 3000)])
+    ap.add_argument("--formats", nargs="+", choices=list(FORMATS), default=list(FORMATS))
+    ap.add_argument("--per-combo", type=int, default=4, help="해상도×포맷 조합당 이미지 수")
+    ap.add_argument("--repeat", type=int, default=2, help="코퍼스 반복 횟수")
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    ap.add_argument("--mode", choices=["direct", "batched"], default="direct",
+                    help="direct: 요청마다 predict / batched: BatchScheduler 경유")
+    ap.add_argument("--max-batch", type=int, default=8)
+    ap.add_argument("--max-wait-ms", type=float, default=10.0)
+    ap.add_argument("--threads", type=int, default=0, help="torch 스레드 수 (0: 기본값)")
+    ap.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    if args.dummy:
+        predictor = dummy_predictor()
+    elif args.lean_model:
+        predictor = LeanPredictor.load_export(args.lean_model, args.threads or None)
+    else:
+        predictor = LeanPredictor(load_model(args.file_id, args.model), num_threads=args.threads or None)
+    if args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+    predictor.warmup()
+    load_s = time.perf_counter() - t0
+
+    corpus = make_corpus(args.resolutions, args.formats, args.per_combo)
+    scheduler = BatchScheduler(predictor, args.max_batch, args.max_wait_ms) if args.mode == "batched" else None
+    predict = scheduler.predict if scheduler else predictor.predict
+
+    print(f"model load+warmup {load_s:.2f}s | corpus {len(corpus)} images "
+          f"({len(args.resolutions)} res × {len(args.formats)} fmt) | mode {args.mode}")
+    print(f"{'conc':>5} | {'req':>5} | {'img/s':>8} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8}")
+    print("-" * 56)
+    results = []
+    for c in args.concurrency:
+        r = run_level(predict, corpus, c, args.repeat)
+        results.append(r)
+        print(f"{c:>5} | {r['requests']:>5} | {r['throughput_rps']:>8.1f} | {r['p50_ms']:>8.1f} | "
+              f"{r['p95_ms']:>8.1f} | {r['p99_ms']:>8.1f}")
+    rss = peak_rss_mb()
+    print(f"\npeak RSS (실행 전체): {rss:.0f} MB" if rss is not None else "\npeak RSS: -")
+
+    print("\n단계별 (마지막 동시성 수준):")
+    for stage, h in results[-1]["stages"].items():
+        print(f"  {stage:<12} n={h['count']:<6} mean={h['mean_ms']:8.2f}  p50={h['p50_ms']:8.2f}  "
+              f"p95={h['p95_ms']:8.2f}  p99={h['p99_ms']:8.2f} ms")
+    if scheduler:
+        print(f"\nscheduler: {scheduler.stats()}")
+        scheduler.stop()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump({"mode": args.mode, "load_s": load_s, "corpus_size": len(corpus),
+                       "resolutions": [f"{w}x{h}" for w, h in args.resolutions], "formats": args.formats,
+                       "peak_rss_mb": rss, "levels": results}, fh, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+# bench_prob_panel.py
+# 확률 패널 렌더링 비교: 기존(전체 정렬 + 라벨마다 st.markdown 1개) vs 상위 k + 기타(HTML 1개)
+# 클래스 수 10 / 100 / 1000 에 대해 전송 HTML 바이트, 요소 수, 생성 시간을 출력한다.
+#
+#   python bench_prob_panel.py --k 20 --runs 200
+import argparse, sys, time
+
+import numpy as np
+
+from prob_panel import top_k, prob_panel_html
+
+
+def legacy_blocks(probs, labels: list[str], pred: str) -> list[str]:
+    """기존 streamlit_app.py 방식: 전체 sorted + 라벨별 HTML 블록."""
+    prob_list = sorted([(labels[i], float(probs[i])) for i in range(len(labels))], key=lambda x: x[1], reverse=True)
+    out = []
+    for lbl, p in prob_list:
+        pct = p * 100
+        hi = "highlight" if lbl == pred else ""
+        out.append(f"""
+                <div class="prob-card">
+                  <div style="display:flex;justify-content:space-between;margin-bottom:6px;">
+                    <strong>{lbl}</strong><span>{pct:.2f}%</span>
+                  </div>
+                  <div class="prob-bar-bg">
+                    <div class="prob-bar-fg {hi}" style="width:{pct:.4f}%;"></div>
+                  </div>
+                </div>
+                """)
+    return out
+
+
+def bench(fn, runs: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - t0) / runs * 1000
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="probability panel render payload/time benchmark")
+    ap.add_argument("--classes", type=int, nargs="+", default=[10, 100, 1000])
+    ap.add_argument("--k", type=int, default=20)
+    ap.add_argument("--runs", type=int, default=200)
+    args = ap.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    print(f"{'classes':>8} | {'mode':<12} | {'elements':>8} | {'bytes':>9} | {'ms/render':>9}")
+    print("-" * 60)
+    for n in args.classes:
+        labels = [f"class_{i:04d}" for i in range(n)]
+        probs = rng.dirichlet(np.ones(n)).astype(np.float32)
+        pred = labels[int(probs.argmax())]
+
+        blocks = legacy_blocks(probs, labels, pred)
+        legacy_bytes = sum(len(b.encode("utf-8")) for b in blocks)
+        legacy_ms = bench(lambda: legacy_blocks(probs, labels, pred), args.runs)
+
+        def render():
+            items, others = top_k(probs, labels, args.k)
+            return prob_panel_html(items, others, pred)
+        html = render()
+        new_ms = bench(render, args.runs)
+
+        print(f"{n:>8} | {'legacy':<12} | {len(blocks):>8} | {legacy_bytes:>9} | {legacy_ms:>9.3f}")
+        print(f"{n:>8} | {f'top-{args.k}':<12} | {1:>8} | {len(html.encode('utf-8')):>9} | {new_ms:>9.3f}")
+    print("\n(요소 수 = st.markdown 호출 수. 요소마다 websocket 델타 메시지가 하나씩 추가로 나간다.)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# bulk.py
+# 여러 장(다중 파일 / ZIP) 분류용 유틸.
+# 이미지는 제너레이터로 한 장씩 꺼내고 청크 단위로만 디코딩하므로, 업로드 개수와 관계없이
+# 디코딩된 이미지는 최대 chunk_size 장만 메모리에 올라간다.
+import os, zipfile
+from typing import Iterable, Iterator
+
+from inference import load_pil_from_bytes
+
+IMG_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff")
+
+
+def is_image_name(name: str) -> bool:
+    base = os.path.basename(name)
+    return base.lower().endswith(IMG_EXTS) and not base.startswith(".")
+
+
+def iter_zip_images(fileobj, prefix: str = "") -> Iterator[tuple[str, bytes]]:
+    """ZIP 안의 이미지 파일을 (이름, 바이트) 로 하나씩 꺼냄."""
+    with zipfile.ZipFile(fileobj) as zf:
+        for info in zf.infolist():
+            if info.is_dir() or info.filename.startswith("__MACOSX/") or not is_image_name(info.filename):
+                continue
+            yield prefix + info.filename, zf.read(info)
+
+
+def iter_uploaded_images(files) -> Iterator[tuple[str, bytes]]:
+    """st.file_uploader(accept_multiple_files=True) 결과 → (이름, 바이트). ZIP 은 풀어서."""
+    for f in files:
+        if f.name.lower().endswith(".zip"):
+            yield from iter_zip_images(f, prefix=f"{f.name}/")
+        else:
+            yield f.name, f.getvalue()
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    chunk = []
+    for x in items:
+        chunk.append(x)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def result_row(name: str, result=None, labels: list[str] | None = None, error: str | None = None) -> dict:
+    """결과 표(CSV/JSONL) 한 행: file, label, confidence, error, 라벨별 확률."""
+    row = {"file": name, "label": None, "confidence": None, "error": error}
+    if result is not None:
+        pred, pred_idx, probs = result
+        row["label"], row["confidence"] = pred, float(probs[pred_idx])
+        row.update({lbl: float(p) for lbl, p in zip(labels or [], probs)})
+    return row
+
+
+def classify_chunks(predictor, items: Iterable[tuple[str, bytes]], labels: list[str],
+                    chunk_size: int = 16) -> Iterator[list[dict]]:
+    """청크 단위로 디코딩 → 배치 예측 → 결과 행(dict) 목록을 yield.
+
+    각 행: file, label, confidence, error, 라벨별 확률. 디코딩/예측에 실패한 파일은 error 만 채움.
+    """
+    for chunk in chunked(items, max(1, int(chunk_size))):
+        rows, pils = [], []
+        for name, b in chunk:
+            row = result_row(name)
+            try:
+                pils.append(load_pil_from_bytes(b))
+            except Exception as e:
+                row["error"] = f"{type(e).__name__}: {e}"
+            rows.append(row)
+        del chunk
+        ok_rows = [r for r in rows if r["error"] is None]
+        try:
+            results = predictor.predict_batch(pils)
+        except Exception as e:
+            # 한 청크의 예측 실패가 이미 끝난 청크 결과까지 날리지 않도록 해당 행에만 기록
+            for row in ok_rows:
+                row["error"] = f"{type(e).__name__}: {e}"
+            results = []
+        for row, res in zip(ok_rows, results):
+            row.update(result_row(row["file"], res, labels))
+        del pils
+        yield rows
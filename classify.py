@@ -0,0 +1,275 @@
+# classify.py
+# Streamlit 없이 폴더/파일 목록을 일괄 분류하는 CLI.
+#
+#   python classify.py ./images --out results.jsonl
+#   python classify.py ./images other.jpg @list.txt --out results.csv --workers 4 --decode-workers 8
+#   python classify.py ./images --out results.jsonl --lean-model model.lean.pt   # fastai 없이 (export_model.py)
+#
+# - 디코딩(EXIF 회전, RGB 변환, 리사이즈)은 decode 프로세스 풀에서
+# - 추론은 --workers 개의 프로세스에서 (프로세스마다 Learner 를 한 번만 로드)
+# - 출력(JSONL/CSV)은 청크마다 바로 기록하므로, 다시 실행하면 이미 기록된 파일은 건너뛴다(resume)
+import argparse, csv, io, json, os, sys, time
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+from artifacts import model_cache_path
+from bulk import is_image_name, chunked, result_row
+from inference import LeanPredictor, ensure_model_file, load_model, load_pil_from_bytes
+
+DEFAULT_FILE_ID = "1lz0i2ZmAmpKPAsUL98Ke_MtqQpXTaKNo"
+
+# ======================
+# 입력/출력
+# ======================
+def collect_inputs(inputs: list[str], recursive: bool = False) -> list[str]:
+    """디렉터리 / 이미지 파일 / @목록파일(한 줄에 경로 하나) → 이미지 경로 목록."""
+    paths = []
+    for item in inputs:
+        if item.startswith("@"):
+            with open(item[1:], encoding="utf-8") as fh:
+                paths += collect_inputs([ln.strip() for ln in fh if ln.strip()], recursive)
+        elif os.path.isdir(item):
+            if recursive:
+                for root, dirs, files in os.walk(item):
+                    dirs.sort()
+                    paths += [os.path.join(root, f) for f in sorted(files) if is_image_name(f)]
+            else:
+                paths += [os.path.join(item, f) for f in sorted(os.listdir(item)) if is_image_name(f)]
+        else:
+            paths.append(item)
+    return paths
+
+
+def output_format(path: str, fmt: str | None) -> str:
+    if fmt: return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def _complete_size(path: str) -> int:
+    """마지막 줄바꿈까지의 바이트 수. 중단된 실행이 남긴 반쪽짜리 마지막 줄은 제외."""
+    with open(path, "rb") as fh:
+        end = fh.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - 65536)
+            fh.seek(start)
+            i = fh.read(end - start).rfind(b"\n")
+            if i >= 0:
+                return start + i + 1
+            end = start
+    return 0
+
+
+def read_done(path: str, fmt: str) -> set[str]:
+    """이미 출력 파일에 기록된 file 값 (resume 용)."""
+    if not os.path.exists(path):
+        return set()
+    with open(path, "rb") as fh:
+        text = fh.read(_complete_size(path)).decode("utf-8", errors="replace")
+    done = set()
+    if fmt == "csv":
+        for row in csv.DictReader(io.StringIO(text, newline="")):
+            # 열이 모자라거나 남는 행, label·error 가 모두 빈 행은 온전히 기록되지 않은 것으로 봄
+            if None in row or None in row.values() or not row.get("file"):
+                continue
+            if row.get("label") or row.get("error"):
+                done.add(row["file"])
+    else:
+        for line in text.splitlines():
+            try:
+                done.add(json.loads(line)["file"])
+            except (ValueError, KeyError, TypeError):
+                continue
+    return done
+
+
+class ResultWriter:
+    def __init__(self, path: str, fmt: str, labels: list[str]):
+        self.fmt = fmt
+        if os.path.exists(path):
+            # 이어 쓰기 전에 잘린 마지막 줄을 잘라내야 새 행이 그 뒤에 붙어 깨지지 않음
+            with open(path, "r+b") as fh:
+                fh.truncate(_complete_size(path))
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.fh = open(path, "a", encoding="utf-8", newline="")
+        if fmt == "csv":
+            self.writer = csv.DictWriter(self.fh, fieldnames=["file", "label", "confidence", "error", *labels])
+            if new: self.writer.writeheader()
+
+    def write(self, rows: list[dict]) -> None:
+        for row in rows:
+            if self.fmt == "csv":
+                self.writer.writerow(row)
+            else:
+                self.fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self.fh.flush()
+
+    def close(self) -> None:
+        self.fh.close()
+
+
+# ======================
+# 워커 (프로세스 풀에서 실행)
+# ======================
+_PREDICTOR = None
+
+
+def _init_infer_worker(file_id: str, model_path: str, num_threads: int, sha256: str | None = None,
+                       url: str | None = None, lean_path: str | None = None) -> None:
+    global _PREDICTOR
+    if lean_path:
+        _PREDICTOR = LeanPredictor.load_export(lean_path, num_threads)
+    else:
+        _PREDICTOR = LeanPredictor(load_model(file_id, model_path, sha256, url), num_threads=num_threads)
+
+
+def _worker_info():
+    return (_PREDICTOR.resize if _PREDICTOR.lean else None), _PREDICTOR.vocab, _PREDICTOR.lean
+
+
+def _decode_chunk(paths: list[str], resize) -> list[tuple[str, np.ndarray | None, str | None]]:
+    """파일 읽기 + 디코딩 (+ 경량 경로면 모델 입력 크기로 리사이즈) → uint8 HWC 배열."""
+    out = []
+    for p in paths:
+        try:
+            with open(p, "rb") as fh:
+                pil = load_pil_from_bytes(fh.read())
+            if resize is not None: pil = resize.apply(pil)
+            out.append((p, np.asarray(pil, dtype=np.uint8), None))
+        except Exception as e:
+            out.append((p, None, f"{type(e).__name__}: {e}"))
+    return out
+
+
+def _infer_chunk(decoded: list[tuple[str, np.ndarray | None, str | None]]) -> list[dict]:
+    import torch
+    from PIL import Image
+    labels = _PREDICTOR.vocab
+    ok = [(p, a) for p, a, err in decoded if err is None]
+    if not ok:
+        results = []
+    elif _PREDICTOR.lean:
+        results = _PREDICTOR.predict_tensors([torch.from_numpy(a).permute(2, 0, 1) for _, a in ok])
+    else:
+        results = _PREDICTOR.predict_batch([Image.fromarray(a) for _, a in ok])
+    by_path = dict(zip((p for p, _ in ok), results))
+    return [result_row(p, by_path.get(p), labels, err) for p, _, err in decoded]
+
+
+# ======================
+# 실행
+# ======================
+# 경량 경로가 아니면 디코드 풀이 원본 해상도 배열을 그대로 넘기므로(12MP ≈ 36MB) 청크를 작게 유지
+FALLBACK_CHUNK_SIZE = 2
+
+
+def plan_cores(cpus: int, workers: int, decode_workers: int | None = None,
+               threads: int | None = None) -> tuple[int, int]:
+    """코어를 디코드 풀과 추론 풀(workers × threads)에 나눠 (decode_workers, threads) 를 정함."""
+    if not decode_workers:
+        used = workers * threads if threads else cpus // 2
+        decode_workers = max(1, cpus - used)
+    threads = threads or max(1, (cpus - decode_workers) // workers)
+    return decode_workers, threads
+
+
+def run(paths: list[str], out: str, fmt: str, model_path: str, file_id: str,
+        workers: int = 1, decode_workers: int | None = None, chunk_size: int = 32,
+        threads: int | None = None, sha256: str | None = None, url: str | None = None,
+        max_inflight: int | None = None, lean_path: str | None = None, log=print) -> int:
+    """paths 를 분류해 out 에 기록. 새로 기록한 개수를 반환.
+
+    max_inflight: 디코딩·추론 중인 이미지 수 상한 (기본: 프로세스마다 한 청크).
+    lean_path: export_model.py 로 만든 TorchScript 파일. 주면 model.pkl 대신 이것을 로드.
+    """
+    done = read_done(out, fmt)
+    todo = [p for p in paths if p not in done]
+    if done: log(f"resume: {len(paths) - len(todo)}개는 이미 기록됨, {len(todo)}개 남음")
+    if not todo:
+        return 0
+
+    cpus = os.cpu_count() or 1
+    workers = max(1, workers)
+    decode_workers, threads = plan_cores(cpus, workers, decode_workers, threads)
+    ctx = mp.get_context("spawn")  # torch 스레드 풀과 fork 의 충돌 방지
+
+    # 모델이 없으면 워커마다 동시에 받지 않도록 먼저 한 번 받아 둔다 (체크섬 확인 포함)
+    if not lean_path:
+        ensure_model_file(file_id, model_path, sha256, url)
+
+    t0, written = time.perf_counter(), 0
+    with ProcessPoolExecutor(workers, mp_context=ctx, initializer=_init_infer_worker,
+                             initargs=(file_id, model_path, threads, sha256, url, lean_path)) as infer_pool, \
+         ProcessPoolExecutor(decode_workers, mp_context=ctx) as decode_pool:
+        resize, labels, lean = infer_pool.submit(_worker_info).result()
+        if not lean: log("⚠️  경량 경로 미지원 모델: learner.predict 로 대체합니다.")
+        writer = ResultWriter(out, fmt, labels)
+        try:
+            chunk_size = max(1, chunk_size if lean else min(chunk_size, FALLBACK_CHUNK_SIZE))
+            chunks = chunked(todo, chunk_size)
+            # 메모리 상한: 동시에 떠 있는 이미지 수 (디코딩된 배열은 추론이 끝날 때까지 살아 있음)
+            max_inflight = max_inflight or chunk_size * (workers + decode_workers)
+            decoding, inferring = {}, {}  # future → 이미지 수
+            pending = None
+            while True:
+                while True:
+                    pending = pending or next(chunks, None)
+                    inflight = sum(decoding.values()) + sum(inferring.values())
+                    if pending is None or (inflight and inflight + len(pending) > max_inflight):
+                        break
+                    decoding[decode_pool.submit(_decode_chunk, pending, resize)] = len(pending)
+                    pending = None
+                if not decoding and not inferring:
+                    break
+                finished, _ = wait([*decoding, *inferring], return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    if fut in decoding:
+                        n = decoding.pop(fut)
+                        inferring[infer_pool.submit(_infer_chunk, fut.result())] = n
+                    else:
+                        inferring.pop(fut)
+                        rows = fut.result()
+                        writer.write(rows)
+                        written += len(rows)
+                        dt = time.perf_counter() - t0
+                        log(f"{written}/{len(todo)}  ({written / dt:.1f} img/s)")
+        finally:
+            writer.close()
+    return written
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="fastai 이미지 분류기 일괄 추론 (JSONL/CSV 출력, resume 지원)")
+    ap.add_argument("inputs", nargs="+", help="이미지 파일, 디렉터리, 또는 @목록파일")
+    ap.add_argument("-o", "--out", required=True, help="출력 파일 (.jsonl 또는 .csv)")
+    ap.add_argument("--format", choices=["jsonl", "csv"], default=None, help="기본값: 확장자로 판단")
+    ap.add_argument("--model", default=os.environ.get("MODEL_PATH", "model.pkl"))
+    ap.add_argument("--file-id", default=os.environ.get("GDRIVE_FILE_ID", DEFAULT_FILE_ID))
+    ap.add_argument("--url", default=os.environ.get("MODEL_URL") or None, help="Google Drive 대신 받을 주소 (http/file)")
+    ap.add_argument("--sha256", default=os.environ.get("MODEL_SHA256") or None, help="모델 파일 체크섬")
+    ap.add_argument("--lean-model", default=os.environ.get("LEAN_MODEL_PATH") or None,
+                    help="export_model.py 로 만든 TorchScript 파일 (주면 --model 대신 사용)")
+    ap.add_argument("--cache-dir", default=os.environ.get("MODEL_CACHE_DIR") or None, help="버전별 모델 캐시 디렉터리")
+    ap.add_argument("-r", "--recursive", action="store_true", help="하위 디렉터리까지 탐색")
+    ap.add_argument("-w", "--workers", type=int, default=1, help="추론 프로세스 수")
+    ap.add_argument("--decode-workers", type=int, default=None, help="디코딩 프로세스 수 (기본: 코어의 절반)")
+    ap.add_argument("--threads", type=int, default=None,
+                    help="추론 프로세스당 torch 스레드 수 (기본: 디코딩에 쓰지 않는 코어/workers)")
+    ap.add_argument("--chunk-size", type=int, default=32)
+    ap.add_argument("--max-inflight", type=int, default=None,
+                    help="동시에 디코딩·추론 중인 이미지 수 상한 (기본: chunk-size × 프로세스 수)")
+    args = ap.parse_args(argv)
+
+    paths = collect_inputs(args.inputs, args.recursive)
+    model_path = model_cache_path(args.model, args.cache_dir, args.sha256, args.url or args.file_id)
+    fmt = output_format(args.out, args.format)
+    log = lambda msg: print(msg, file=sys.stderr, flush=True)
+    n = run(paths, args.out, fmt, model_path, args.file_id, args.workers, args.decode_workers,
+            args.chunk_size, args.threads, args.sha256, args.url, args.max_inflight, args.lean_model, log=log)
+    log(f"완료: {n}개 기록 → {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
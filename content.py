@@ -0,0 +1,121 @@
+# content.py
+# 라벨별 고정 콘텐츠(텍스트/이미지/동영상): 소스 코드 대신 manifest.json + 에셋 디렉터리에서 읽는다.
+#
+# manifest.json 형식 (각 라벨당 최대 3개씩 표시):
+#   {"labels": [
+#     {"index": 0,            # 모델 vocab 순서 (labels[0]) — 또는 "label": "라벨명"
+#      "texts":  ["짬뽕의 특징과 유래", "국물 맛 포인트"],
+#      "images": ["jjampong1.png", "https://.../jjampong2.jpg"],   # 에셋 디렉터리 기준 경로 또는 URL
+#      "videos": ["https://youtu.be/XXXXXXXXXXX"]},
+#   ]}
+#
+# 로컬 이미지는 한 번만 디코딩·썸네일로 줄여 PNG 바이트로 메모리에 캐시(LRU)하고 st.image 로 내보낸다.
+# (Streamlit 미디어 URL 은 내용 해시 기반이라 브라우저 캐시가 그대로 적용됨)
+import os, re, json, base64
+from io import BytesIO
+from functools import lru_cache
+
+from PIL import Image
+
+THUMB_SIZE = (480, 480)
+
+
+def load_manifest(path: str) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh).get("labels", [])
+
+
+def content_by_label(entries: list[dict], labels: list[str]) -> dict[str, dict[str, list[str]]]:
+    """manifest 항목 → {라벨명: {"texts", "images", "videos"}}. vocab 범위를 벗어난 index 는 무시."""
+    out = {}
+    for e in entries:
+        label = e.get("label")
+        if label is None:
+            idx = e.get("index")
+            if not isinstance(idx, int) or not 0 <= idx < len(labels):
+                continue
+            label = labels[idx]
+        out[str(label)] = {k: list(e.get(k, [])) for k in ("texts", "images", "videos")}
+    return out
+
+
+# ======================
+# 이미지 (썸네일 캐시)
+# ======================
+def is_remote(ref: str) -> bool:
+    return ref.startswith(("http://", "https://"))
+
+
+def thumbnail_bytes(ref: str, assets_dir: str, max_size: tuple[int, int] = THUMB_SIZE) -> bytes:
+    """로컬 파일(에셋 디렉터리 기준) 또는 data: URI → 썸네일 PNG 바이트.
+
+    파일 mtime 을 캐시 키에 넣어, 에셋을 고치면 재시작 없이 새 썸네일을 만든다.
+    """
+    mtime = 0 if ref.startswith("data:") else os.stat(os.path.join(assets_dir, ref)).st_mtime_ns
+    return _thumbnail(ref, assets_dir, mtime, tuple(max_size))
+
+
+@lru_cache(maxsize=64)
+def _thumbnail(ref: str, assets_dir: str, mtime: int, max_size: tuple[int, int]) -> bytes:
+    if ref.startswith("data:"):
+        src = BytesIO(base64.b64decode(ref.split(",", 1)[1]))
+    else:
+        src = os.path.join(assets_dir, ref)
+    with Image.open(src) as im:
+        im.thumbnail(max_size)
+        buf = BytesIO()
+        im.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+# ======================
+# 텍스트/동영상 카드 HTML (라벨별로 한 번만 생성)
+# ======================
+def yt_id_from_url(url: str) -> str | None:
+    if not url: return None
+    pats = [r"(?:v=|/)([0-9A-Za-z_-]{11})(?:\?|&|/|$)", r"youtu\.be/([0-9A-Za-z_-]{11})"]
+    for p in pats:
+        m = re.search(p, url)
+        if m: return m.group(1)
+    return None
+
+
+def yt_thumb(url: str) -> str | None:
+    vid = yt_id_from_url(url)
+    return f"https://img.youtube.com/vi/{vid}/hqdefault.jpg" if vid else None
+
+
+@lru_cache(maxsize=256)
+def text_cards_html(texts: tuple[str, ...]) -> str:
+    cards = "".join(f"""
+    <div class="card" style="grid-column:span 12;">
+      <h4>텍스트</h4>
+      <div>{t}</div>
+    </div>""" for t in texts)
+    return f'<div class="info-grid">{cards}</div>'
+
+
+@lru_cache(maxsize=256)
+def video_cards_html(videos: tuple[str, ...]) -> str:
+    cards = []
+    for v in videos:
+        thumb = yt_thumb(v)
+        if thumb:
+            cards.append(f"""
+    <div class="card" style="grid-column:span 6;">
+      <h4>동영상</h4>
+      <a href="{v}" target="_blank" class="thumb-wrap">
+        <img src="{thumb}" class="thumb"/>
+        <div class="play"></div>
+      </a>
+      <div class="helper">{v}</div>
+    </div>""")
+        else:
+            cards.append(f"""
+    <div class="card" style="grid-column:span 6;">
+      <h4>동영상</h4>
+      <a href="{v}" target="_blank">{v}</a>
+    </div>""")
+    return f'<div class="info-grid">{"".join(cards)}</div>'
@@ -0,0 +1,40 @@
+# export_model.py
+# model.pkl(fastai Learner) → 사전 변환 가중치(TorchScript + vocab/전처리 메타) 파일.
+# 앱에서 LEAN_MODEL_PATH 로 지정하면 fastai import 와 Learner unpickle 없이 바로 로드된다.
+#
+#   python export_model.py --model model.pkl --out model.lean.pt
+import argparse, os, sys, time
+
+from inference import LeanPredictor, load_model
+
+DEFAULT_FILE_ID = "1lz0i2ZmAmpKPAsUL98Ke_MtqQpXTaKNo"
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="fastai Learner → TorchScript 경량 모델 변환")
+    ap.add_argument("--model", default=os.environ.get("MODEL_PATH", "model.pkl"))
+    ap.add_argument("--file-id", default=os.environ.get("GDRIVE_FILE_ID", DEFAULT_FILE_ID))
+    ap.add_argument("-o", "--out", default="model.lean.pt")
+    args = ap.parse_args(argv)
+
+    import numpy as np
+    from PIL import Image
+    src = LeanPredictor(load_model(args.file_id, args.model))
+    if not src.lean:
+        print("이 모델의 transform 구성은 경량 경로를 지원하지 않아 변환할 수 없습니다.", file=sys.stderr)
+        return 1
+    src.export(args.out)
+
+    # 변환 결과가 원본과 같은지 간단히 확인
+    t0 = time.perf_counter()
+    dst = LeanPredictor.load_export(args.out)
+    load_s = time.perf_counter() - t0
+    img = Image.fromarray(np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8))
+    (_, i1, pr1), (_, i2, pr2) = src.predict(img), dst.predict(img)
+    diff = float(np.abs(pr1 - pr2).max())
+    print(f"저장: {args.out}  (로드 {load_s:.2f}s, 원본 대비 max|Δp| = {diff:.2e}, 라벨 {'일치' if i1 == i2 else '불일치'})")
+    return 0 if i1 == i2 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+# inference.py
+# fastai Learner.predict 의 호출당 오버헤드(1장짜리 test DataLoader 생성, 전체 transform/decode 파이프라인)를
+# 피하기 위한 경량 추론 엔진.
+# Learner 에서 모델/정규화 통계/리사이즈 설정을 한 번만 꺼내고, 이후에는 텐서 연산만으로 전처리한다.
+# torch/fastai 는 첫 페이지 렌더링을 막지 않도록 실제로 필요할 때 import 한다.
+from __future__ import annotations
+import json
+from io import BytesIO
+from typing import TYPE_CHECKING
+import numpy as np
+from PIL import Image, ImageOps
+
+from metrics import metrics
+
+if TYPE_CHECKING:
+    import torch
+
+# 검증(valid) 단계에서 아무 일도 하지 않거나, 아래에서 직접 구현한 transform 들
+_ITEM_PASSTHRU = {"ToTensor"}
+_BATCH_PASSTHRU = {"IntToFloatTensor", "Normalize"}
+# 출력이 단일 클래스 인덱스(argmax)인 손실 함수만 경량 경로 지원
+_SINGLE_LABEL_LOSSES = {"CrossEntropyLossFlat", "FocalLossFlat", "LabelSmoothingCrossEntropyFlat"}
+_PAD_MODES = {"zeros": "constant", "reflection": "reflect", "border": "edge"}
+
+
+class ResizeSpec:
+    """fastai Resize(valid 모드)와 같은 결과를 내기 위한 설정값."""
+
+    def __init__(self, size: tuple[int, int], method: str = "crop", pad_mode: str = "reflection",
+                 resample=Image.BILINEAR, pcts: tuple[float, float] = (0.5, 0.5)):
+        self.size = (int(size[0]), int(size[1]))  # (w, h)
+        self.method = str(method)
+        self.pad_mode = str(pad_mode)
+        self.resample = resample
+        self.pcts = pcts
+
+    def to_dict(self) -> dict:
+        return {"size": list(self.size), "method": self.method, "pad_mode": self.pad_mode,
+                "resample": int(self.resample), "pcts": list(self.pcts)}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> ResizeSpec:
+        return cls(tuple(d["size"]), d["method"], d["pad_mode"], d["resample"], tuple(d["pcts"]))
+
+    def apply(self, pil: Image.Image) -> Image.Image:
+        w, h = pil.size
+        tw, th = self.size
+        if self.method == "squish":
+            return pil.resize((tw, th), self.resample)
+        # crop: 짧은 쪽 기준으로 중앙 crop / pad: 긴 쪽 기준으로 중앙 pad
+        rw, rh = w / tw, h / th
+        m = max(rw, rh) if self.method == "pad" else min(rw, rh)
+        cw, ch = int(m * tw), int(m * th)
+        left, top = int(self.pcts[0] * (w - cw)), int(self.pcts[1] * (h - ch))
+        if left >= 0 and top >= 0:
+            pil = pil.crop((left, top, left + cw, top + ch))
+        else:
+            pil = pil.crop((max(left, 0), max(top, 0), min(left + cw, w), min(top + ch, h)))
+            arr = np.asarray(pil)
+            pad_l, pad_t = max(-left, 0), max(-top, 0)
+            pad_r, pad_b = max(cw - w + left, 0), max(ch - h + top, 0)
+            arr = np.pad(arr, ((pad_t, pad_b), (pad_l, pad_r), (0, 0)),
+                         mode=_PAD_MODES.get(self.pad_mode, "reflect"))
+            pil = Image.fromarray(arr)
+        return pil.resize((tw, th), self.resample)
+
+
+def ensure_model_file(file_id: str, output_path: str, sha256: str | None = None, url: str | None = None) -> str:
+    """model.pkl 이 없거나 체크섬이 틀릴 때만 받음 (기본: Google Drive, url 지정 시 그 주소)."""
+    from artifacts import fetch_artifact, gdrive_url
+    return fetch_artifact(url or gdrive_url(file_id), output_path, sha256)
+
+
+def load_model(file_id: str, output_path: str, sha256: str | None = None, url: str | None = None):
+    """model.pkl 을 받아(필요할 때만) fastai Learner 로 로드."""
+    ensure_model_file(file_id, output_path, sha256, url)
+    from fastai.learner import load_learner
+    return load_learner(output_path, cpu=True)
+
+
+def load_pil_from_bytes(b: bytes) -> Image.Image:
+    with metrics.timer("decode"):
+        pil = Image.open(BytesIO(b))
+        pil = ImageOps.exif_transpose(pil)
+        if pil.mode != "RGB": pil = pil.convert("RGB")
+        return pil
+
+
+def _tfm_name(t) -> str:
+    return type(t).__name__
+
+
+def _valid_tfms(pipeline):
+    # split_idx == 0 인 transform 은 학습 전용이라 추론 시에는 적용되지 않음
+    return [t for t in getattr(pipeline, "fs", []) if getattr(t, "split_idx", None) != 0]
+
+
+class LeanPredictor:
+    """learner.predict 와 같은 (pred, pred_idx, probs) 를 반환하는 경량 추론기.
+
+    지원하지 않는 transform 구성이면 자동으로 learner.predict 로 대체한다(`self.lean` 이 False).
+    `export()` 로 TorchScript + 메타데이터 파일을 만들어 두면 `load_export()` 로 fastai 없이 더 빨리 로드된다.
+    """
+
+    def __init__(self, learner, num_threads: int | None = None):
+        import torch
+        if num_threads:
+            torch.set_num_threads(int(num_threads))
+        self.learner = learner
+        self.vocab = [str(x) for x in learner.dls.vocab]
+        self.model = learner.model.eval().cpu()
+        loss_func = getattr(learner, "loss_func", None)
+        self.activation = getattr(loss_func, "activation", None) or _softmax
+        self.decodes = getattr(loss_func, "decodes", None) or _argmax
+        self.resize, self.mean, self.std = None, None, None
+        self.lean = self._extract(learner.dls)
+
+    def _extract(self, dls) -> bool:
+        import torch
+        if _tfm_name(getattr(self.learner, "loss_func", None)) not in _SINGLE_LABEL_LOSSES:
+            return False
+        for t in _valid_tfms(dls.after_item):
+            name = _tfm_name(t)
+            if name == "Resize":
+                self.resize = ResizeSpec(t.size, getattr(t, "method", "crop"),
+                                         getattr(t, "pad_mode", "reflection"),
+                                         getattr(t, "mode", Image.BILINEAR))
+            elif name not in _ITEM_PASSTHRU:
+                return False
+        if self.resize is None:
+            # 리사이즈가 없으면 이미지마다 크기가 달라 배치로 묶을 수 없음 → learner.predict 로 대체
+            return False
+        for t in _valid_tfms(dls.after_batch):
+            name = _tfm_name(t)
+            if name == "Normalize":
+                self.mean = torch.as_tensor(t.mean).float().cpu().view(1, -1, 1, 1)
+                self.std = torch.as_tensor(t.std).float().cpu().view(1, -1, 1, 1)
+            elif name not in _BATCH_PASSTHRU:
+                return False
+        return True
+
+    # ---------- 사전 변환 가중치 (TorchScript + vocab/전처리 메타) ----------
+    def export(self, path: str) -> str:
+        """TorchScript 모델과 vocab/리사이즈/정규화 정보를 한 파일로 저장."""
+        import torch
+        if not self.lean:
+            raise ValueError("경량 경로를 지원하지 않는 모델은 export 할 수 없습니다.")
+        w, h = self.resize.size if self.resize is not None else (224, 224)
+        with torch.inference_mode():
+            traced = torch.jit.trace(self.model, torch.zeros(1, 3, h, w), check_trace=False)
+        meta = {
+            "vocab": self.vocab,
+            "resize": self.resize.to_dict() if self.resize is not None else None,
+            "mean": self.mean.flatten().tolist() if self.mean is not None else None,
+            "std": self.std.flatten().tolist() if self.std is not None else None,
+        }
+        torch.jit.save(traced, path, _extra_files={"meta.json": json.dumps(meta, ensure_ascii=False)})
+        return path
+
+    @classmethod
+    def load_export(cls, path: str, num_threads: int | None = None) -> LeanPredictor:
+        import torch
+        if num_threads:
+            torch.set_num_threads(int(num_threads))
+        extra = {"meta.json": ""}
+        model = torch.jit.load(path, map_location="cpu", _extra_files=extra)
+        meta = json.loads(extra["meta.json"])
+        resize = ResizeSpec.from_dict(meta["resize"]) if meta.get("resize") else None
+        return cls.from_model(model, meta["vocab"], resize, meta.get("mean"), meta.get("std"))
+
+    @classmethod
+    def from_model(cls, model, vocab: list[str], resize: ResizeSpec | None = None,
+                   mean=None, std=None) -> LeanPredictor:
+        """Learner 없이 (모델, vocab, 전처리 설정) 으로 직접 구성. softmax + argmax 사용."""
+        import torch
+        self = cls.__new__(cls)
+        self.learner = None
+        self.vocab = [str(x) for x in vocab]
+        self.model = model.eval()
+        self.activation, self.decodes = _softmax, _argmax
+        self.resize = resize
+        self.mean = torch.as_tensor(mean).float().view(1, -1, 1, 1) if mean is not None else None
+        self.std = torch.as_tensor(std).float().view(1, -1, 1, 1) if std is not None else None
+        self.lean = True
+        return self
+
+    def warmup(self) -> None:
+        """더미 이미지로 한 번 추론해 JIT/메모리 할당기 초기화 비용을 미리 치름."""
+        w, h = self.resize.size if self.resize is not None else (224, 224)
+        self.predict(Image.new("RGB", (w, h)))
+
+    # ---------- 전처리/순전파 ----------
+    def preprocess(self, pil: Image.Image) -> torch.Tensor:
+        """PIL(RGB) → uint8 CHW 텐서 (정규화는 배치 단위로 forward 에서)."""
+        import torch
+        with metrics.timer("preprocess"):
+            if pil.mode != "RGB": pil = pil.convert("RGB")
+            if self.resize is not None: pil = self.resize.apply(pil)
+            return torch.from_numpy(np.array(pil, dtype=np.uint8)).permute(2, 0, 1)
+
+    def forward(self, batch: torch.Tensor) -> torch.Tensor:
+        """uint8 NCHW 배치 → 확률(activation 적용) NxC."""
+        import torch
+        with metrics.timer("forward"), torch.inference_mode():
+            x = batch.float().div_(255.)
+            if self.mean is not None:
+                x = (x - self.mean) / self.std
+            return self.activation(self.model(x))
+
+    def postprocess(self, probs: torch.Tensor) -> list[tuple[str, int, np.ndarray]]:
+        with metrics.timer("postprocess"):
+            idxs = self.decodes(probs)
+            probs = probs.float().numpy()
+            return [(self.vocab[int(i)], int(i), probs[j]) for j, i in enumerate(idxs)]
+
+    # ---------- 예측 ----------
+    def predict(self, pil: Image.Image) -> tuple[str, int, np.ndarray]:
+        return self.predict_batch([pil])[0]
+
+    def predict_batch(self, pils: list[Image.Image]) -> list[tuple[str, int, np.ndarray]]:
+        if not pils:
+            return []
+        if not self.lean:
+            return [self._predict_fallback(p) for p in pils]
+        return self.predict_tensors([self.preprocess(p) for p in pils])
+
+    def predict_tensors(self, tensors: list[torch.Tensor]) -> list[tuple[str, int, np.ndarray]]:
+        """preprocess() 결과(uint8 CHW) 목록을 한 번의 forward 로 예측."""
+        import torch
+        return self.postprocess(self.forward(torch.stack(tensors)))
+
+    def _predict_fallback(self, pil: Image.Image):
+        from fastai.vision.core import PILImage
+        with metrics.timer("learner_predict"):
+            pred, pred_idx, probs = self.learner.predict(PILImage.create(np.array(pil)))
+        return str(pred), int(pred_idx), np.asarray(probs, dtype=np.float32)
+
+
+def _softmax(x):
+    return x.softmax(dim=-1)
+
+
+def _argmax(x):
+    return x.argmax(dim=-1)
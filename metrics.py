@@ -0,0 +1,124 @@
+# metrics.py
+# 추론 파이프라인 계측: 단계별(decode / preprocess / forward / postprocess ...) 소요 시간 히스토그램과
+# 이벤트 카운터(캐시 hit/miss, 모델 로드 등). 프로세스 전역 레지스트리 `metrics` 하나를 공유한다.
+#
+#   with metrics.timer("decode"): ...
+#   metrics.event("cache.hit")
+#   metrics.snapshot() / metrics.dump_json("metrics.json")
+import os, json, time, bisect, logging, threading
+from collections import deque
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+# 히스토그램 버킷 상한(ms). 마지막 버킷은 그 이상 전부
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+BUCKET_LABELS = [f"<={b}" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+
+
+class Histogram:
+    """고정 버킷 누적 카운트 + 최근 샘플(백분위 계산용)."""
+
+    def __init__(self, window: int = 4096):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.recent: deque[float] = deque(maxlen=window)
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.min = min(self.min, ms)
+        self.max = max(self.max, ms)
+        self.recent.append(ms)
+
+    def summary(self) -> dict:
+        xs = sorted(self.recent)
+        pct = lambda q: xs[min(len(xs) - 1, int(q * len(xs)))] if xs else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "min_ms": self.min if self.count else 0.0,
+            "max_ms": self.max,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+            "buckets": {lbl: c for lbl, c in zip(BUCKET_LABELS, self.counts) if c},
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hists: dict[str, Histogram] = {}
+        self._events: dict[str, int] = {}
+        self.started = time.time()
+        self._last_dump = float("-inf")
+
+    def observe(self, stage: str, ms: float) -> None:
+        with self._lock:
+            h = self._hists.get(stage)
+            if h is None:
+                h = self._hists[stage] = Histogram()
+            h.observe(ms)
+
+    @contextmanager
+    def timer(self, stage: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - t0) * 1000)
+
+    def event(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._events[name] = self._events.get(name, 0) + n
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hists.clear()
+            self._events.clear()
+            self.started = time.time()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "uptime_s": time.time() - self.started,
+                "stages": {k: h.summary() for k, h in sorted(self._hists.items())},
+                "events": dict(sorted(self._events.items())),
+            }
+
+    def dump_json(self, path: str | None = None, extra: dict | None = None, min_interval: float = 0.0) -> str:
+        """스냅샷을 JSON 문자열로 (path 가 있으면 파일로도) 내보냄.
+
+        파일은 임시 파일에 쓴 뒤 os.replace 로 바꿔 읽는 쪽이 반쯤 쓴 JSON 을 보지 않게 하고,
+        마지막으로 쓴 지 min_interval 초가 지나지 않았으면 파일 쓰기는 건너뛴다. 쓰기 실패는 로그만 남긴다.
+        """
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        text = json.dumps(data, ensure_ascii=False, indent=2, default=str)
+        if path:
+            now = time.monotonic()
+            with self._lock:
+                due = now - self._last_dump >= min_interval
+                if due:
+                    self._last_dump = now
+            if due:
+                tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                try:
+                    with open(tmp, "w", encoding="utf-8") as fh:
+                        fh.write(text)
+                    os.replace(tmp, path)
+                except OSError as e:
+                    # 진단용 기록이 실패했다고 요청 처리를 막지 않음 (다음 기록은 min_interval 뒤에 다시 시도)
+                    log.warning("metrics dump to %s failed: %s", path, e)
+                    try: os.remove(tmp)
+                    except OSError: pass
+        return text
+
+
+metrics = Metrics()
@@ -0,0 +1,176 @@
+# pred_cache.py
+# 이미지 바이트 + 모델 식별자 해시를 키로 쓰는 예측 결과 캐시
+# - 메모리: LRU(최대 개수) + TTL, 세션 간 공유(스레드 안전)
+# - 디스크(선택): 재시작 후에도 유지되는 2차 캐시. 공유 디렉터리일 수 있으므로 피클이 아닌 .npz(allow_pickle=False)
+import os, time, hashlib, threading
+from collections import OrderedDict
+
+import numpy as np
+
+from metrics import metrics
+
+
+def model_identity(file_id: str, model_path: str) -> str:
+    """모델 식별자: FILE_ID + MODEL_PATH + 파일 mtime. 모델 파일이 바뀌면 키도 바뀜."""
+    try:
+        mtime = os.path.getmtime(model_path)
+    except OSError:
+        mtime = 0.0
+    return f"{file_id}|{model_path}|{mtime:.6f}"
+
+
+def cache_key(img_bytes: bytes, model_id: str) -> str:
+    h = hashlib.sha256()
+    h.update(model_id.encode("utf-8"))
+    h.update(b"\0")
+    h.update(img_bytes)
+    return h.hexdigest()
+
+
+class PredictionCache:
+    """(pred, pred_idx, probs) 를 저장하는 LRU + TTL 캐시."""
+
+    def __init__(self, max_entries: int = 256, ttl: float | None = 3600.0,
+                 disk_dir: str | None = None, max_disk_entries: int = 10000):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.disk_dir = disk_dir or None
+        self.max_disk_entries = max(1, int(max_disk_entries))
+        self._mem: OrderedDict[str, tuple[float, tuple]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._puts = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    # ---------- 조회/저장 ----------
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            item = self._mem.get(key)
+            if item is not None:
+                ts, value = item
+                if self._fresh(ts, now):
+                    self._mem.move_to_end(key)
+                    self.hits += 1
+                    metrics.event("cache.hit")
+                    return value
+                del self._mem[key]
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                metrics.event("cache.miss")
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            metrics.event("cache.hit")
+            metrics.event("cache.disk_hit")
+            self._mem_put(key, value, now)
+        return value
+
+    def put(self, key: str, value: tuple) -> None:
+        now = time.time()
+        with self._lock:
+            self._mem_put(key, value, now)
+            self._puts += 1
+            prune = self.disk_dir and self._puts % 64 == 0
+        self._disk_put(key, value)
+        if prune:
+            self._disk_prune()
+
+    def get_or_compute(self, key: str, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+
+    # ---------- 통계 ----------
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._mem),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate,
+            }
+
+    # ---------- 내부 ----------
+    def _fresh(self, ts: float, now: float) -> bool:
+        return self.ttl is None or now - ts <= self.ttl
+
+    def _mem_put(self, key: str, value: tuple, now: float) -> None:
+        self._mem[key] = (now, value)
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.npz")
+
+    def _disk_get(self, key: str, now: float):
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            if not self._fresh(os.path.getmtime(path), now):
+                os.remove(path)
+                return None
+            with np.load(path, allow_pickle=False) as data:
+                return str(data["pred"]), int(data["idx"]), data["probs"].copy()
+        except OSError:
+            return None
+        except Exception:
+            # 깨졌거나 형식이 맞지 않는 파일: miss 로 처리하고 삭제
+            try: os.remove(path)
+            except OSError: pass
+            return None
+
+    def _disk_put(self, key: str, value: tuple) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            pred, idx, probs = value
+            with open(tmp, "wb") as fh:
+                np.savez(fh, pred=np.array(str(pred)), idx=np.array(int(idx)), probs=np.asarray(probs))
+            os.replace(tmp, path)
+        except OSError:
+            try: os.remove(tmp)
+            except OSError: pass
+
+    def _disk_prune(self) -> None:
+        # 오래된 파일부터 지워 max_disk_entries 이하로 유지
+        try:
+            entries = []
+            for e in os.scandir(self.disk_dir):
+                if e.name.endswith(".npz"):
+                    entries.append(e)
+                elif e.name.endswith(".pkl"):  # 예전 피클 형식 캐시는 더 이상 읽지 않으므로 정리
+                    try: os.remove(e.path)
+                    except OSError: pass
+        except OSError:
+            return
+        if len(entries) <= self.max_disk_entries:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for e in entries[:len(entries) - self.max_disk_entries]:
+            try: os.remove(e.path)
+            except OSError: pass
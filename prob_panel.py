@@ -0,0 +1,41 @@
+# prob_panel.py
+# "상세 예측 확률" 패널: 상위 k개만 부분 선택(argpartition)으로 뽑고 나머지는 "기타" 하나로 합쳐,
+# 라벨마다 st.markdown 을 부르는 대신 HTML 한 덩어리로 만든다.
+from html import escape
+
+import numpy as np
+
+OTHERS_LABEL = "기타"
+
+
+def top_k(probs, labels: list[str], k: int | None = None) -> tuple[list[tuple[str, float]], tuple[int, float] | None]:
+    """확률 상위 k개 [(라벨, p)] (내림차순)와 나머지 묶음 (개수, 합). k 가 없거나 전체 이상이면 전체 정렬."""
+    p = np.asarray(probs, dtype=np.float64).ravel()
+    n = len(p)
+    if not k or k >= n:
+        idx = np.argsort(-p, kind="stable")
+        return [(labels[i], float(p[i])) for i in idx], None
+    part = np.argpartition(-p, k - 1)[:k]          # O(n) 부분 선택
+    idx = part[np.argsort(-p[part], kind="stable")]  # k 개만 정렬
+    rest = float(p.sum() - p[idx].sum())
+    return [(labels[i], float(p[i])) for i in idx], (n - k, max(rest, 0.0))
+
+
+def _card(label: str, p: float, highlight: bool = False) -> str:
+    pct = p * 100
+    hi = "highlight" if highlight else ""
+    return (
+        '<div class="prob-card">'
+        '<div style="display:flex;justify-content:space-between;margin-bottom:6px;">'
+        f'<strong>{escape(label)}</strong><span>{pct:.2f}%</span></div>'
+        f'<div class="prob-bar-bg"><div class="prob-bar-fg {hi}" style="width:{pct:.4f}%;"></div></div>'
+        '</div>'
+    )
+
+
+def prob_panel_html(items: list[tuple[str, float]], others: tuple[int, float] | None, pred: str | None) -> str:
+    cards = [_card(lbl, p, lbl == pred) for lbl, p in items]
+    if others is not None:
+        n, p = others
+        cards.append(_card(f"{OTHERS_LABEL} ({n}개)", p))
+    return "".join(cards)
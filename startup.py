@@ -0,0 +1,142 @@
+# startup.py
+# 백그라운드 모델 로더: 페이지는 바로 그리고, 모델은 별도 스레드에서 준비한다.
+# 단계별 소요 시간(import / download / deserialize / warmup)을 부팅마다 로그로 남긴다.
+import os, time, logging, threading
+
+from batcher import BatchScheduler
+from metrics import metrics
+
+log = logging.getLogger(__name__)
+
+
+class ModelLoader:
+    """state: "loading" → "ready" | "error". 준비되면 self.predictor 와 scheduler() 사용 가능.
+
+    retry_after(초) 를 주면 실패 후 그만큼(실패할 때마다 두 배, 최대 10분) 기다렸다가 같은 객체에서 다시 로드한다.
+    """
+
+    MAX_RETRY_DELAY = 600.0
+
+    def __init__(self, file_id: str, model_path: str, lean_path: str = "", num_threads: int | None = None,
+                 sha256: str | None = None, url: str | None = None, retry_after: float | None = None):
+        self.file_id = file_id
+        self.model_path = model_path
+        self.sha256 = sha256
+        self.url = url
+        self.lean_path = lean_path
+        self.num_threads = num_threads
+        self.retry_after = retry_after
+        self.failures = 0
+        self.next_retry_at: float | None = None  # time.time(), 자동 재시도 예정 시각
+        self.state = "loading"
+        self.stage = "시작"
+        self.error: str | None = None
+        self.predictor = None
+        self.source = model_path
+        self.timings: dict[str, float] = {}
+        self.finished_at: float | None = None  # time.time(), 성공/실패와 관계없이 로드가 끝난 시각
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._scheduler: BatchScheduler | None = None
+        self._scheduler_key: tuple | None = None
+        self._retry_timer: threading.Timer | None = None
+        self._start()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._load, name="model-loader", daemon=True)
+        self._thread.start()
+
+    def retry(self) -> bool:
+        """실패 상태일 때만 다시 로드 시작. 여러 세션이 동시에 불러도 한 번만 재시작된다."""
+        with self._lock:
+            if self.state != "error":
+                return False
+            if self._retry_timer is not None:
+                self._retry_timer.cancel()
+                self._retry_timer = None
+            self.state, self.stage, self.error = "loading", "재시도", None
+            self.timings, self.finished_at, self.next_retry_at = {}, None, None
+            self._ready.clear()
+            self._start()
+        return True
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "ready"
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self._ready.wait(timeout)
+        return self.ready
+
+    def scheduler(self, max_batch: int = 8, max_wait_ms: float = 10.0) -> BatchScheduler:
+        """이 로더의 predictor 에 묶인 배칭 워커. 설정이 바뀌면 이전 워커를 멈추고 새로 만든다."""
+        if not self.ready:
+            raise RuntimeError("모델이 아직 준비되지 않았습니다.")
+        key = (max_batch, max_wait_ms)
+        with self._lock:
+            old = None
+            if self._scheduler is None or self._scheduler_key != key:
+                old = self._scheduler
+                self._scheduler = BatchScheduler(self.predictor, max_batch, max_wait_ms)
+                self._scheduler_key = key
+            sched = self._scheduler
+        if old is not None:
+            old.stop()
+        return sched
+
+    def close(self) -> None:
+        """배칭 워커 정리 (로더가 다른 로더로 교체될 때)."""
+        with self._lock:
+            sched, self._scheduler = self._scheduler, None
+        if sched is not None:
+            sched.stop()
+
+    def _step(self, name: str, label: str, fn):
+        self.stage = label
+        t0 = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            self.timings[name] = time.perf_counter() - t0
+
+    def _load(self) -> None:
+        t0 = time.perf_counter()
+        try:
+            from inference import LeanPredictor, ensure_model_file
+            use_lean = bool(self.lean_path) and os.path.exists(self.lean_path)
+            if use_lean:
+                self.source = self.lean_path
+                self._step("import", "torch 불러오는 중", lambda: __import__("torch"))
+                self.timings["download"] = 0.0
+                self.predictor = self._step("deserialize", "경량 모델 로드 중",
+                                            lambda: LeanPredictor.load_export(self.lean_path, self.num_threads))
+            else:
+                self._step("import", "fastai 불러오는 중", lambda: __import__("fastai.learner"))
+                self._step("download", "모델 다운로드 중", lambda: ensure_model_file(self.file_id, self.model_path, self.sha256, self.url))
+                from fastai.learner import load_learner
+                learner = self._step("deserialize", "모델 역직렬화 중",
+                                     lambda: load_learner(self.model_path, cpu=True))
+                self.predictor = LeanPredictor(learner, num_threads=self.num_threads)
+            self._step("warmup", "워밍업 추론 중", self.predictor.warmup)
+            self.state = "ready"
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            self.failures += 1
+            if self.retry_after:
+                delay = min(self.retry_after * 2 ** (self.failures - 1), self.MAX_RETRY_DELAY)
+                self.next_retry_at = time.time() + delay
+                self._retry_timer = threading.Timer(delay, self.retry)
+                self._retry_timer.daemon = True
+                self._retry_timer.start()
+            self.state = "error"
+            log.exception("model load failed")
+        finally:
+            self.timings["total"] = time.perf_counter() - t0
+            self.finished_at = time.time()
+            self.stage = self.state
+            for k, v in self.timings.items():
+                metrics.observe(f"model_load.{k}", v * 1000)
+            metrics.event(f"model_load.{self.state}")
+            self._ready.set()
+            log.info("startup timings (s): %s  source=%s",
+                     " ".join(f"{k}={v:.2f}" for k, v in self.timings.items()), self.source)
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import multiprocessing as mp
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from artifacts import ArtifactError, fetch_artifact
+
+PAYLOAD = os.urandom(300_000)
+SHA = hashlib.sha256(PAYLOAD).hexdigest()
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Range / If-Range 를 지원하는 최소 HTTP 서버. server.payload, server.etag 로 내용을 바꿀 수 있음."""
+    protocol_version = "HTTP/1.0"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        srv = self.server
+        srv.requests.append(dict(self.headers))
+        body, total = srv.payload, len(srv.payload)
+        rng = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if rng and (if_range is None or if_range == srv.etag):
+            start = int(rng.split("=")[1].split("-")[0])
+            if start >= total:
+                self.send_response(416)
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{total - 1}/{total}")
+            body = body[start:]
+        else:
+            self.send_response(200)
+        if not srv.truncate:
+            self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", srv.etag)
+        self.end_headers()
+        if srv.truncate:
+            body = body[:srv.truncate]
+        for i in range(0, len(body), 65536):
+            self.wfile.write(body[i:i + 65536])
+            time.sleep(srv.delay)
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    srv.payload, srv.etag, srv.requests, srv.truncate, srv.delay = PAYLOAD, '"v1"', [], 0, 0.0
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    srv.url = f"http://127.0.0.1:{srv.server_address[1]}/model.pkl"
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _partial(dest, url, n, etag='"v1"', length=len(PAYLOAD)):
+    with open(f"{dest}.part", "wb") as fh:
+        fh.write(PAYLOAD[:n])
+    with open(f"{dest}.part.meta", "w", encoding="utf-8") as fh:
+        json.dump({"url": url, "etag": etag, "length": length}, fh)
+
+
+def _read(path):
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+def test_http_resume_continues_from_part(server, tmp_path):
+    dest = str(tmp_path / "model.pkl")
+    _partial(dest, server.url, 100_000)
+    fetch_artifact(server.url, dest, SHA)
+    assert _read(dest) == PAYLOAD
+    assert server.requests[-1]["Range"] == "bytes=100000-"
+    assert not os.path.exists(f"{dest}.part") and not os.path.exists(f"{dest}.part.meta")
+
+
+def test_http_changed_source_restarts_download(server, tmp_path):
+    dest = str(tmp_path / "model.pkl")
+    _partial(dest, server.url, 100_000, etag='"v0"')
+    server.payload = PAYLOAD[::-1]
+    fetch_artifact(server.url, dest)
+    assert _read(dest) == PAYLOAD[::-1]
+
+
+@pytest.mark.parametrize("meta", [None, "other"])
+def test_stale_part_without_matching_source_is_discarded(server, tmp_path, meta):
+    dest = str(tmp_path / "model.pkl")
+    with open(f"{dest}.part", "wb") as fh:
+        fh.write(b"garbage from another model")
+    if meta:
+        with open(f"{dest}.part.meta", "w", encoding="utf-8") as fh:
+            json.dump({"url": "http://elsewhere/model.pkl"}, fh)
+    fetch_artifact(server.url, dest)  # sha 없이도 엉뚱한 .part 를 이어받지 않음
+    assert _read(dest) == PAYLOAD
+    assert "Range" not in server.requests[-1]
+
+
+def test_short_body_fails_size_check_and_resumes_next_time(server, tmp_path):
+    dest = str(tmp_path / "model.pkl")
+    _partial(dest, server.url, 100_000)
+    server.truncate = 50_000  # Content-Length 없이 연결이 일찍 끊김 → Content-Range 전체 길이로 확인
+    with pytest.raises(ArtifactError, match="크기 불일치"):
+        fetch_artifact(server.url, dest)
+    assert os.path.getsize(f"{dest}.part") == 150_000 and not os.path.exists(dest)
+    server.truncate = 0
+    fetch_artifact(server.url, dest, SHA)
+    assert _read(dest) == PAYLOAD
+    assert server.requests[-1]["Range"] == "bytes=150000-"
+
+
+def test_file_url_checksum_mismatch_leaves_nothing(tmp_path):
+    src = tmp_path / "src.pkl"
+    src.write_bytes(PAYLOAD)
+    dest = str(tmp_path / "out" / "model.pkl")
+    with pytest.raises(ArtifactError, match="체크섬"):
+        fetch_artifact(src.as_uri(), dest, "0" * 64)
+    assert not os.path.exists(dest) and not os.path.exists(f"{dest}.part")
+    assert fetch_artifact(src.as_uri(), dest, SHA) == dest
+    assert _read(dest) == PAYLOAD and os.path.exists(f"{dest}.sha256")
+
+
+def test_file_url_changed_source_is_not_resumed(tmp_path):
+    src = tmp_path / "src.pkl"
+    src.write_bytes(PAYLOAD)
+    dest = str(tmp_path / "model.pkl")
+    _partial(dest, src.as_uri(), 100_000, etag="old")
+    fetch_artifact(src.as_uri(), dest, SHA)
+    assert _read(dest) == PAYLOAD
+
+
+def _fetch(url, dest, sha):
+    return fetch_artifact(url, dest, sha)
+
+
+def test_concurrent_fetch_downloads_once(server, tmp_path):
+    server.delay = 0.02
+    dest = str(tmp_path / "model.pkl")
+    with mp.get_context("spawn").Pool(4) as pool:
+        results = pool.starmap(_fetch, [(server.url, dest, SHA)] * 4)
+    assert results == [dest] * 4
+    assert len(server.requests) == 1
+    assert _read(dest) == PAYLOAD
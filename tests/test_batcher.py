@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from batcher import BatchScheduler
+
+
+class StubPredictor:
+    """preprocess 는 입력을 그대로, predict_tensors 는 입력을 결과로 돌려주는 가짜 추론기."""
+    lean = True
+
+    def __init__(self, fail_on=None, gate: threading.Event | None = None):
+        self.fail_on = fail_on
+        self.gate = gate
+        self.batches: list[list] = []
+
+    def preprocess(self, x):
+        return x
+
+    def predict_tensors(self, xs):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.batches.append(list(xs))
+        if self.fail_on is not None and self.fail_on in xs:
+            raise RuntimeError("boom")
+        return [("label", x, x * 10) for x in xs]
+
+
+def test_results_go_back_to_their_callers_and_respect_max_batch():
+    stub = StubPredictor()
+    sched = BatchScheduler(stub, max_batch=4, max_wait_ms=5)
+    try:
+        with ThreadPoolExecutor(16) as pool:
+            results = list(pool.map(lambda i: sched.predict(i, timeout=5), range(200)))
+    finally:
+        sched.stop()
+    assert results == [("label", i, i * 10) for i in range(200)]
+    assert all(1 <= len(b) <= 4 for b in stub.batches)
+    assert sorted(x for b in stub.batches for x in b) == list(range(200))
+    assert sched.stats()["requests"] == 200
+
+
+def test_failing_batch_sets_exception_on_every_future():
+    stub = StubPredictor(fail_on=3)
+    sched = BatchScheduler(stub, max_batch=4, max_wait_ms=20)
+    try:
+        futs = [sched.submit(i) for i in range(12)]
+        done = [(i, f.exception(5)) for i, f in enumerate(futs)]
+    finally:
+        sched.stop()
+    failed = next(b for b in stub.batches if 3 in b)
+    for i, exc in done:
+        if i in failed:
+            assert isinstance(exc, RuntimeError)
+        else:
+            assert exc is None and futs[i].result() == ("label", i, i * 10)
+    assert sched.stats()["errors"] == 1
+
+
+def test_stop_finishes_pending_batch():
+    gate = threading.Event()
+    stub = StubPredictor(gate=gate)
+    sched = BatchScheduler(stub, max_batch=8, max_wait_ms=50)
+    futs = [sched.submit(i) for i in range(5)]
+    stopper = threading.Thread(target=sched.stop)
+    stopper.start()
+    gate.set()
+    stopper.join(5)
+    assert not stopper.is_alive()
+    assert [f.result(0) for f in futs] == [("label", i, i * 10) for i in range(5)]
+    assert not sched._thread.is_alive()
+
+
+def test_stop_is_idempotent_and_rejects_new_requests():
+    sched = BatchScheduler(StubPredictor(), max_batch=2, max_wait_ms=0)
+    sched.stop()
+    sched.stop()
+    with pytest.raises(RuntimeError):
+        sched.submit(1)
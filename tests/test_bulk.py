@@ -0,0 +1,45 @@
+import io
+import zipfile
+
+from PIL import Image
+
+from bulk import classify_chunks, iter_zip_images
+
+
+def _png(color) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (8, 8), color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class StubPredictor:
+    def __init__(self, fail_chunks=()):
+        self.calls = 0
+        self.fail_chunks = set(fail_chunks)
+
+    def predict_batch(self, pils):
+        self.calls += 1
+        if self.calls in self.fail_chunks:
+            raise RuntimeError("out of memory")
+        return [("a", 0, [1.0, 0.0]) for _ in pils]
+
+
+def test_failed_chunk_is_recorded_per_row_and_later_chunks_continue():
+    items = [(f"{i}.png", _png("red")) for i in range(5)] + [("bad.png", b"not an image")]
+    chunks = list(classify_chunks(StubPredictor(fail_chunks={2}), items, ["a", "b"], chunk_size=2))
+    rows = [r for c in chunks for r in c]
+    assert [r["file"] for r in rows] == [f"{i}.png" for i in range(5)] + ["bad.png"]
+    assert [r["label"] for r in rows] == ["a", "a", None, None, "a", None]
+    assert rows[2]["error"] == rows[3]["error"] == "RuntimeError: out of memory"
+    assert rows[5]["error"] and rows[5]["label"] is None
+    assert rows[0]["error"] is None and rows[0]["a"] == 1.0
+
+
+def test_iter_zip_images_skips_non_images_and_macos_metadata():
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("x/1.png", _png("blue"))
+        zf.writestr("__MACOSX/x/._1.png", b"junk")
+        zf.writestr("x/readme.txt", b"hi")
+    buf.seek(0)
+    assert [n for n, _ in iter_zip_images(buf, prefix="z.zip/")] == ["z.zip/x/1.png"]
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from classify import ResultWriter, plan_cores, read_done
+
+LABELS = ["a", "b"]
+
+
+def _row(name, label="a"):
+    return {"file": name, "label": label, "confidence": 0.9, "error": None, "a": 0.9, "b": 0.1}
+
+
+def test_jsonl_resume_drops_torn_last_line(tmp_path):
+    out = tmp_path / "out.jsonl"
+    w = ResultWriter(str(out), "jsonl", LABELS)
+    w.write([_row("1.jpg"), _row("2.jpg")])
+    w.close()
+    with open(out, "a", encoding="utf-8") as fh:
+        fh.write('{"file": "3.jpg", "label": "a"}')  # 줄바꿈 전에 중단 — JSON 으로는 멀쩡해도 미완료
+    assert read_done(str(out), "jsonl") == {"1.jpg", "2.jpg"}
+
+    w = ResultWriter(str(out), "jsonl", LABELS)
+    w.write([_row("3.jpg")])
+    w.close()
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(ln)["file"] for ln in lines] == ["1.jpg", "2.jpg", "3.jpg"]
+
+
+def test_csv_resume_ignores_partial_rows(tmp_path):
+    out = tmp_path / "out.csv"
+    w = ResultWriter(str(out), "csv", LABELS)
+    w.write([_row("1.jpg"), {"file": "bad.jpg", "label": None, "confidence": None, "error": "OSError: x"}])
+    w.close()
+    with open(out, "a", encoding="utf-8", newline="") as fh:
+        fh.write("2.jpg,a\r\n3.jpg,,,,,\r\n4.jpg,a,0.")  # 열 부족 / 모두 빈 값 / 줄바꿈 전 중단
+    assert read_done(str(out), "csv") == {"1.jpg", "bad.jpg"}
+
+    w = ResultWriter(str(out), "csv", LABELS)
+    w.write([_row("4.jpg")])
+    w.close()
+    text = out.read_bytes().decode("utf-8")
+    assert text.endswith("4.jpg,a,0.9,,0.9,0.1\r\n")
+    assert "0.4.jpg" not in text
+    assert read_done(str(out), "csv") == {"1.jpg", "bad.jpg", "4.jpg"}
+
+
+def test_csv_header_rewritten_when_only_a_torn_header_remains(tmp_path):
+    out = tmp_path / "out.csv"
+    out.write_text("file,lab", encoding="utf-8")
+    w = ResultWriter(str(out), "csv", LABELS)
+    w.write([_row("1.jpg")])
+    w.close()
+    assert out.read_text(encoding="utf-8").splitlines()[0] == "file,label,confidence,error,a,b"
+    assert read_done(str(out), "csv") == {"1.jpg"}
+
+
+def test_plan_cores_does_not_oversubscribe():
+    for cpus in (1, 2, 4, 8, 16, 64):
+        for workers in (1, 2, 4):
+            decode, threads = plan_cores(cpus, workers)
+            assert decode >= 1 and threads >= 1
+            if cpus >= 2 * workers:
+                assert decode + workers * threads <= cpus
+    assert plan_cores(16, 2, threads=4) == (8, 4)
+    assert plan_cores(16, 2, decode_workers=4) == (4, 6)
+
+
+def test_run_end_to_end_with_lean_model(tmp_path):
+    pytest.importorskip("torch")
+    from bench_pipeline import dummy_predictor, make_corpus
+    from classify import run
+    lean = dummy_predictor().export(str(tmp_path / "dummy.lean.pt"))
+    paths = []
+    for i, (name, data) in enumerate(make_corpus([(64, 48), (200, 120)], ["jpeg", "png"], 3)):
+        paths.append(str(tmp_path / f"{i:02d}_{name}"))
+        with open(paths[-1], "wb") as fh:
+            fh.write(data)
+    (tmp_path / "broken.jpg").write_bytes(b"nope")
+    paths.append(str(tmp_path / "broken.jpg"))
+
+    outputs = {}
+    for workers in (1, 2):
+        out = str(tmp_path / f"out{workers}.jsonl")
+        assert run(paths, out, "jsonl", "", "", workers=workers, decode_workers=1, chunk_size=4,
+                   threads=1, lean_path=lean, log=lambda msg: None) == len(paths)
+        with open(out, encoding="utf-8") as fh:
+            outputs[workers] = {r["file"]: r for r in map(json.loads, fh)}
+        assert run(paths, out, "jsonl", "", "", lean_path=lean, log=lambda msg: None) == 0  # resume
+    assert set(outputs[1]) == set(paths)
+    assert outputs[1][paths[-1]]["error"] and outputs[1][paths[0]]["label"]
+    assert {f: r["label"] for f, r in outputs[1].items()} == {f: r["label"] for f, r in outputs[2].items()}
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+from PIL import Image
+
+from content import content_by_label, thumbnail_bytes
+
+
+def test_content_by_label_by_index_and_name():
+    entries = [{"index": 1, "texts": ["t"]}, {"label": "x", "images": ["a.png"]}, {"index": 9}]
+    out = content_by_label(entries, ["a", "b"])
+    assert out == {"b": {"texts": ["t"], "images": [], "videos": []},
+                   "x": {"texts": [], "images": ["a.png"], "videos": []}}
+
+
+def test_thumbnail_bytes_bad_assets_raise_oserror(tmp_path):
+    # 앱은 OSError/ValueError 를 잡아 해당 이미지만 건너뜀
+    (tmp_path / "broken.png").write_bytes(b"not a png")
+    with pytest.raises(OSError):
+        thumbnail_bytes("missing.png", str(tmp_path))
+    with pytest.raises(OSError):
+        thumbnail_bytes("broken.png", str(tmp_path))
+    Image.new("RGB", (960, 480)).save(tmp_path / "ok.png")
+    assert thumbnail_bytes("ok.png", str(tmp_path))[:8] == b"\x89PNG\r\n\x1a\n"
+
+
+def test_thumbnail_bytes_refreshes_when_asset_changes(tmp_path):
+    path = tmp_path / "a.png"
+    Image.new("RGB", (64, 64), "red").save(path)
+    first = thumbnail_bytes("a.png", str(tmp_path))
+    assert thumbnail_bytes("a.png", str(tmp_path)) is first  # 그대로면 캐시
+    Image.new("RGB", (64, 64), "blue").save(path)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = thumbnail_bytes("a.png", str(tmp_path))
+    assert second != first
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from inference import ResizeSpec
+
+# (원본 w, h, 목표 크기) — 마지막 두 개는 pad 에서 한 축은 pad, 다른 축은 1px crop 되는 경우
+CASES = [(320, 240, 224), (240, 320, 224), (224, 224, 224), (640, 123, (96, 160)),
+         (10, 61, 224), (10, 63, 460)]
+
+
+def _image(w: int, h: int) -> Image.Image:
+    rng = np.random.default_rng(w * 1000 + h)
+    return Image.fromarray(rng.integers(0, 256, (h, w, 3), dtype=np.uint8))
+
+
+def _wh(size):
+    return (size, size) if isinstance(size, int) else (size[1], size[0])  # fastai 순서 (h, w) → (w, h)
+
+
+@pytest.mark.parametrize("method", ["crop", "pad", "squish"])
+@pytest.mark.parametrize("w,h,size", CASES)
+def test_resize_spec_output_size(method, w, h, size):
+    out = ResizeSpec(_wh(size), method).apply(_image(w, h))
+    assert out.size == _wh(size)
+    assert out.mode == "RGB"
+
+
+def test_resize_spec_roundtrip_dict():
+    spec = ResizeSpec((64, 48), "pad", "zeros")
+    assert ResizeSpec.from_dict(spec.to_dict()).to_dict() == spec.to_dict()
+
+
+@pytest.mark.parametrize("pad_mode", ["reflection", "zeros", "border"])
+@pytest.mark.parametrize("method", ["crop", "pad", "squish"])
+@pytest.mark.parametrize("w,h,size", CASES)
+def test_resize_spec_matches_fastai(method, pad_mode, w, h, size):
+    augment = pytest.importorskip("fastai.vision.augment")
+    from fastai.vision.core import PILImage
+    tfm = augment.Resize(size, method=method, pad_mode=pad_mode)
+    img = _image(w, h)
+    expected = np.array(tfm(PILImage.create(np.array(img)), split_idx=1))
+    got = np.array(ResizeSpec(tfm.size, tfm.method, tfm.pad_mode, tfm.mode).apply(img))
+    np.testing.assert_array_equal(got, expected)
+
+
+def test_no_resize_falls_back_to_learner_predict():
+    torch = pytest.importorskip("torch")
+    from inference import LeanPredictor
+
+    class CrossEntropyLossFlat:
+        pass
+
+    class ToTensor:
+        split_idx = None
+
+    class Pipeline:
+        def __init__(self, fs): self.fs = fs
+
+    class Dls:
+        vocab = ["a", "b"]
+        after_item = Pipeline([ToTensor()])
+        after_batch = Pipeline([])
+
+    class Learner:
+        dls = Dls()
+        model = torch.nn.Linear(2, 2)
+        loss_func = CrossEntropyLossFlat()
+
+    assert LeanPredictor(Learner()).lean is False
+
+
+def _tiny_learner(path, method):
+    """합성 이미지 3 클래스 + 작은 CNN (사전학습 가중치 없이) 으로 만든 fastai Learner."""
+    import torch
+    from fastai.vision.all import (CrossEntropyLossFlat, ImageDataLoaders, Learner, Normalize, Resize,
+                                   imagenet_stats)
+    for c, label in enumerate(["red", "green", "blue"]):
+        (path / label).mkdir()
+        for i in range(4):
+            img = np.array(_image(40 + 7 * i + c, 30 + 11 * i))
+            img[..., c] = 255 - img[..., c] // 4  # 클래스마다 채널 하나를 강조
+            Image.fromarray(img).save(path / label / f"{i}.png")
+    dls = ImageDataLoaders.from_folder(path, valid_pct=0.25, seed=0, bs=4, num_workers=0,
+                                       item_tfms=Resize((24, 32), method=method),
+                                       batch_tfms=Normalize.from_stats(*imagenet_stats))
+    torch.manual_seed(0)
+    model = torch.nn.Sequential(
+        torch.nn.Conv2d(3, 8, 3, stride=2, padding=1), torch.nn.ReLU(),
+        torch.nn.AdaptiveAvgPool2d(1), torch.nn.Flatten(), torch.nn.Linear(8, len(dls.vocab)),
+    )
+    with torch.no_grad():
+        model[-1].weight.mul_(20)  # 확률이 고르게 붙지 않도록 logit 간격을 벌림
+    return Learner(dls, model, loss_func=CrossEntropyLossFlat())
+
+
+def _sample_images(path):
+    return [Image.open(p).convert("RGB") for p in sorted(path.glob("*/*.png"))]
+
+
+@pytest.mark.parametrize("method", ["crop", "pad", "squish"])
+def test_lean_predictor_matches_learner_predict(tmp_path, method):
+    pytest.importorskip("fastai.vision.all")
+    from fastai.vision.core import PILImage
+    from inference import LeanPredictor
+    learn = _tiny_learner(tmp_path, method)
+    predictor = LeanPredictor(learn)
+    assert predictor.lean
+    pils = _sample_images(tmp_path)
+    batch = predictor.predict_batch(pils)
+    for pil, (label, idx, probs) in zip(pils, batch):
+        exp_label, exp_idx, exp_probs = learn.predict(PILImage.create(np.array(pil)))
+        assert (label, idx) == (str(exp_label), int(exp_idx))
+        np.testing.assert_allclose(probs, exp_probs.numpy(), atol=1e-5)
+        one = predictor.predict(pil)
+        assert one[:2] == (label, idx)
+        np.testing.assert_allclose(one[2], probs, atol=1e-5)
+
+
+def test_export_roundtrip_matches_original(tmp_path):
+    pytest.importorskip("fastai.vision.all")
+    from inference import LeanPredictor
+    data = tmp_path / "data"
+    data.mkdir()
+    predictor = LeanPredictor(_tiny_learner(data, "pad"))
+    path = predictor.export(str(tmp_path / "model.lean.pt"))
+    loaded = LeanPredictor.load_export(path)
+    assert loaded.vocab == predictor.vocab
+    assert loaded.resize.to_dict() == predictor.resize.to_dict()
+    pils = _sample_images(data)
+    for (l1, i1, p1), (l2, i2, p2) in zip(predictor.predict_batch(pils), loaded.predict_batch(pils)):
+        assert (l1, i1) == (l2, i2)
+        np.testing.assert_allclose(p1, p2, atol=1e-5)
@@ -0,0 +1,27 @@
+import json
+import os
+
+from metrics import Metrics
+
+
+def test_dump_json_writes_atomically_and_throttles(tmp_path):
+    m = Metrics()
+    path = tmp_path / "metrics.json"
+    m.observe("decode", 1.0)
+    m.dump_json(str(path), extra={"n": 1}, min_interval=60)
+    m.observe("decode", 2.0)
+    text = m.dump_json(str(path), extra={"n": 2}, min_interval=60)  # 60초 안: 파일은 그대로
+    assert json.loads(text)["n"] == 2
+    assert json.loads(path.read_text(encoding="utf-8"))["n"] == 1
+    m.dump_json(str(path), extra={"n": 3})
+    assert json.loads(path.read_text(encoding="utf-8"))["stages"]["decode"]["count"] == 2
+    assert os.listdir(tmp_path) == ["metrics.json"]  # 임시 파일이 남지 않음
+
+
+def test_dump_json_unwritable_path_logs_and_returns_text(tmp_path, caplog):
+    m = Metrics()
+    path = tmp_path / "missing-dir" / "metrics.json"
+    text = m.dump_json(str(path), extra={"n": 1})
+    assert json.loads(text)["n"] == 1
+    assert "metrics dump" in caplog.text
+    assert not path.parent.exists()
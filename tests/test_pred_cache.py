@@ -0,0 +1,101 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+import pred_cache
+from pred_cache import PredictionCache, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = FakeClock()
+    monkeypatch.setattr(pred_cache, "time", c)
+    return c
+
+
+def _value(i):
+    return (f"label{i}", i, np.array([0.1, 0.9], dtype=np.float32) + i)
+
+
+def _assert_value(got, i):
+    exp = _value(i)
+    assert got[:2] == exp[:2]
+    np.testing.assert_array_equal(got[2], exp[2])
+
+
+def test_lru_evicts_least_recently_used(clock):
+    c = PredictionCache(max_entries=2, ttl=None)
+    c.put("a", _value(0))
+    c.put("b", _value(1))
+    assert c.get("a") is not None  # a 가 최근 사용 → b 가 밀려남
+    c.put("c", _value(2))
+    assert c.get("b") is None
+    assert c.get("a") is not None and c.get("c") is not None
+
+
+def test_memory_ttl_expiry(clock):
+    c = PredictionCache(ttl=10)
+    c.put("a", _value(0))
+    clock.now += 9
+    assert c.get("a") is not None
+    clock.now += 2
+    assert c.get("a") is None
+    assert c.stats()["entries"] == 0
+
+
+def test_disk_tier_promotes_to_memory_and_expires(tmp_path, clock):
+    c = PredictionCache(max_entries=4, ttl=10, disk_dir=str(tmp_path))
+    c.put("k", _value(3))
+    c.clear()  # 메모리만 비움 → 디스크에서 읽어야 함
+    _assert_value(c.get("k"), 3)
+    assert c.disk_hits == 1
+    os.remove(tmp_path / "k.npz")
+    _assert_value(c.get("k"), 3)  # 이제 메모리에 있음
+    assert c.disk_hits == 1
+
+    c.put("old", _value(4))
+    c.clear()
+    clock.now += 11
+    assert c.get("old") is None
+    assert not (tmp_path / "old.npz").exists()  # 만료된 파일은 삭제
+
+
+def test_disk_files_are_not_pickles(tmp_path, clock):
+    c = PredictionCache(disk_dir=str(tmp_path))
+    c.put("k", _value(1))
+    with np.load(tmp_path / "k.npz", allow_pickle=False) as data:
+        assert str(data["pred"]) == "label1"
+
+
+@pytest.mark.parametrize("content", [b"", b"garbage", b"PK\x03\x04broken"])
+def test_corrupt_disk_entry_is_a_miss_and_deleted(tmp_path, clock, content):
+    c = PredictionCache(disk_dir=str(tmp_path))
+    (tmp_path / "bad.npz").write_bytes(content)
+    assert c.get("bad") is None
+    assert not (tmp_path / "bad.npz").exists()
+    assert c.misses == 1
+
+
+def test_hit_miss_counters(clock):
+    c = PredictionCache()
+    assert c.hit_rate == 0.0
+    calls = []
+    compute = lambda: calls.append(1) or _value(0)
+    key = cache_key(b"img", "model")
+    c.get_or_compute(key, compute)
+    c.get_or_compute(key, compute)
+    c.get_or_compute(key, compute)
+    assert len(calls) == 1
+    assert (c.hits, c.misses) == (2, 1)
+    assert c.hit_rate == pytest.approx(2 / 3)
+    assert cache_key(b"img", "other") != key
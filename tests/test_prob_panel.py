@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from prob_panel import OTHERS_LABEL, prob_panel_html, top_k
+
+LABELS = [f"l{i}" for i in range(10)]
+
+
+def _probs(seed=0):
+    p = np.random.default_rng(seed).random(len(LABELS))
+    return p / p.sum()
+
+
+@pytest.mark.parametrize("k", [1, 3, 9])
+def test_top_k_selects_largest_in_order_and_buckets_the_rest(k):
+    p = _probs()
+    items, others = top_k(p, LABELS, k)
+    order = np.argsort(-p)
+    assert [lbl for lbl, _ in items] == [LABELS[i] for i in order[:k]]
+    assert [v for _, v in items] == pytest.approx(list(p[order[:k]]))
+    assert others[0] == len(LABELS) - k
+    assert others[1] == pytest.approx(p[order[k:]].sum())
+
+
+@pytest.mark.parametrize("k", [None, 0, 10, 50])
+def test_top_k_without_limit_sorts_everything(k):
+    p = _probs(1)
+    items, others = top_k(p, LABELS, k)
+    assert others is None
+    assert [lbl for lbl, _ in items] == [LABELS[i] for i in np.argsort(-p)]
+
+
+def test_panel_escapes_labels_and_highlights_only_prediction():
+    items = [("<b>맛</b>", 0.6), ("a&b", 0.3)]
+    html = prob_panel_html(items, (3, 0.1), "a&b")
+    assert "<b>맛</b>" not in html and "&lt;b&gt;맛&lt;/b&gt;" in html
+    assert "a&amp;b" in html
+    assert html.count("prob-bar-fg highlight") == 1
+    cards = html.split('<div class="prob-card">')[1:]
+    assert "highlight" in cards[1] and "highlight" not in cards[0]
+    assert f"{OTHERS_LABEL} (3개)" in cards[2] and "highlight" not in cards[2]
+    assert prob_panel_html(items, None, None).count("highlight") == 0
@@ -0,0 +1,72 @@
+import threading
+import time
+
+from startup import ModelLoader
+
+
+def test_failed_load_reports_error_and_finish_time(tmp_path):
+    before = time.time()
+    loader = ModelLoader("unused", str(tmp_path / "model.pkl"), url=(tmp_path / "missing.pkl").as_uri())
+    assert loader.wait(timeout=30) is False
+    assert loader.state == "error" and loader.error
+    assert loader.finished_at is not None and loader.finished_at >= before
+    assert "total" in loader.timings
+
+
+class _StubPredictor:
+    lean = True
+    vocab = ["a"]
+
+    def preprocess(self, x):
+        return x
+
+    def predict_tensors(self, xs):
+        return [("a", 0, x) for x in xs]
+
+
+def _ready_loader(tmp_path):
+    loader = ModelLoader("unused", str(tmp_path / "model.pkl"), url=(tmp_path / "missing.pkl").as_uri())
+    loader.wait(timeout=30)
+    loader.predictor, loader.state = _StubPredictor(), "ready"
+    return loader
+
+
+def test_scheduler_belongs_to_the_loader_and_is_replaced_on_new_settings(tmp_path):
+    a, b = _ready_loader(tmp_path), _ready_loader(tmp_path)
+    s1 = a.scheduler(4, 5)
+    assert a.scheduler(4, 5) is s1 and b.scheduler(4, 5) is not s1
+    s2 = a.scheduler(8, 5)
+    assert s2 is not s1 and not s1._thread.is_alive()
+    assert s2.predict(7, timeout=5) == ("a", 0, 7)
+    a.close()
+    b.close()
+    assert not s2._thread.is_alive()
+
+
+def test_retry_restarts_only_a_failed_loader_once(tmp_path):
+    src = tmp_path / "missing.pkl"
+    loader = ModelLoader("unused", str(tmp_path / "model.pkl"), url=src.as_uri())
+    assert loader.wait(timeout=30) is False
+    first = loader._thread
+    gate = threading.Event()
+    loader._load = gate.wait  # 재시작된 로드가 끝나지 않게 붙잡아 둠
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(loader.retry())) for _ in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert results.count(True) == 1  # 여러 세션이 동시에 눌러도 재시작은 한 번
+    assert loader._thread is not first and loader.state == "loading"
+    gate.set()
+    loader.state = "ready"
+    assert loader.retry() is False
+
+
+def test_failed_loader_retries_automatically_with_backoff(tmp_path):
+    loader = ModelLoader("unused", str(tmp_path / "model.pkl"), url=(tmp_path / "missing.pkl").as_uri(),
+                         retry_after=0.05)
+    deadline = time.time() + 10
+    while loader.failures < 3 and time.time() < deadline:
+        time.sleep(0.02)
+    assert loader.failures >= 3
+    loader.retry_after = None  # 이후로는 자동 재시도 중단
+    loader.wait(timeout=30)